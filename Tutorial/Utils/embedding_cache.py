@@ -0,0 +1,35 @@
+import hashlib
+import os
+
+import numpy as np
+
+def cached_encode_chunks(model, texts, chunk_size=256, cache_path="emb_cache.npz", **encode_kwargs):
+    ## Same as cached_encode() below, but yields the embeddings chunk_size texts at a time, so the caller can 
+    ## start using (e.g. inserting) the first chunk while the next one is being encoded.
+    ## The cache file is read once at the start and written once at the end.
+    cache = dict(np.load(cache_path)) if os.path.exists(cache_path) else {}
+    updated = False
+
+    for start in range(0, len(texts), chunk_size):
+        chunk = texts[start:start + chunk_size]
+        keys = [hashlib.sha1(text.encode("utf-8")).hexdigest() for text in chunk]
+        missing = {key: text for key, text in zip(keys, chunk) if key not in cache}
+
+        if missing:
+            new_embeddings = model.encode(list(missing.values()), **encode_kwargs)
+            for key, embedding in zip(missing, new_embeddings):
+                cache[key] = np.asarray(embedding, dtype=np.float32)
+            updated = True
+
+        yield np.stack([cache[key] for key in keys])
+
+    if updated:
+        np.savez(cache_path, **cache)
+
+def cached_encode(model, texts, cache_path="emb_cache.npz", **encode_kwargs):
+    ## Encode a list of texts, re-using embeddings saved to disk by earlier runs. 
+    ## Each text is looked up by the SHA1 hash of its contents, so only new or changed texts are sent to the model.
+    ## The cache belongs to one model (and one set of encode options) - use a different cache_path if you change them.
+    ## Every call reads the whole cache file (and rewrites it on a miss), so use it for the corpus of notes, not for single queries.
+    chunks = cached_encode_chunks(model, texts, chunk_size=max(len(texts), 1), cache_path=cache_path, **encode_kwargs)
+    return np.concatenate(list(chunks))
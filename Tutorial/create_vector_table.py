@@ -1,6 +1,11 @@
+import binascii
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from Utils.get_iris_connection import get_cursor
-import pandas as pd
+from Utils.embedding_cache import cached_encode_chunks
 from sentence_transformers import SentenceTransformer
+import torch
 
 
 if __name__=="__main__":
@@ -11,21 +16,27 @@ if __name__=="__main__":
     FROM VectorSearchApp.DocumentReference"""
 
     cursor.execute(sql)
-    out = cursor.fetchall()
 
-    cols = ["ClinicalNotes", "Patient"] 
+    # Fetch and decode the notes 1000 rows at a time, so only one batch of the (twice as long) hex strings
+    # is held in memory at once. The driver has no Arrow/columnar fetch, and a DataFrame adds nothing here
+    patient_ids = []
+    notes = []
+    while rows := cursor.fetchmany(1000):
+        for note_hex, patient in rows:
+            patient_ids.append(int(str(patient).removeprefix("Patient/")))
+            notes.append(binascii.a2b_hex(note_hex).decode("utf-8", errors="replace"))
 
-    df = pd.DataFrame(out, columns=cols)
-    df["PatientID"] = pd.to_numeric(df["Patient"].astype(str).str.strip("Patient/"))
-    df["NotesDecoded"] = df["ClinicalNotes"].apply(lambda x: bytes.fromhex(x).decode("utf-8", errors="replace"))
+    # Half precision on a GPU (CUDA or Apple MPS) roughly doubles encoding speed; CPUs stay float32
+    device = "cuda" if torch.cuda.is_available() else ("mps" if torch.backends.mps.is_available() else "cpu")
+    model_kwargs = {"torch_dtype": torch.float16} if device != "cpu" else {}
+    model = SentenceTransformer('all-MiniLM-L6-v2', device=device, model_kwargs=model_kwargs) 
 
-    model = SentenceTransformer('all-MiniLM-L6-v2') 
-
-    # Generate embeddings for all descriptions at once. Batch processing makes it faster
-    embeddings = model.encode(df['NotesDecoded'].tolist(), normalize_embeddings=True)
-
-    # Add the embeddings to the DataFrame
-    df['Notes_Vector'] = embeddings.tolist()
+    # Batch processing makes encoding faster, and encode() sorts the notes by length before batching,
+    # so short notes aren't padded out to the longest one
+    # Larger batches keep the CPU/GPU busier than the default of 32
+    batch_size = 128 if device == "cuda" else 64
+    # Notes are encoded and inserted 256 at a time, so the database can insert one chunk while the next is encoded
+    chunk_size = 256
 
     table_name = "VectorSearch.DocRefVectors"
 
@@ -33,15 +44,50 @@ if __name__=="__main__":
     CREATE TABLE {table_name} (
     PatientID INTEGER,
     ClinicalNotes LONGVARCHAR,
-    NotesVector VECTOR(DOUBLE, 384)
+    NotesVector VECTOR(FLOAT, 384)
     )
     """
 
     cursor.execute(create_table_query)
 
-    insert_query = f"INSERT INTO {table_name} ( PatientID, ClinicalNotes, NotesVector) values (?, ?, TO_VECTOR(?))"
+    insert_query = f"INSERT INTO {table_name} ( PatientID, ClinicalNotes, NotesVector) values (?, ?, TO_VECTOR(?, float))"
+
+    # A bounded queue keeps the encoder at most a few chunks ahead of the inserts
+    chunks = queue.Queue(maxsize=4)
+    stop = threading.Event()
+
+    def encode_chunks():
+        try:
+            # inference_mode() is per thread, so it has to be entered here
+            # Re-runs only encode notes that aren't already in emb_cache.npz
+            with torch.inference_mode():
+                for embeddings in cached_encode_chunks(model, notes, chunk_size=chunk_size,
+                                                       batch_size=batch_size, normalize_embeddings=True):
+                    if stop.is_set():
+                        break
+                    chunks.put(embeddings)
+        finally:
+            chunks.put(None)
 
-    df["Notes_Vector_str"] = df["Notes_Vector"].astype(str)
-    rows_list = df[["PatientID", "NotesDecoded", "Notes_Vector_str"]].values.tolist()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        producer = executor.submit(encode_chunks)
+        start = 0
+        try:
+            while (embeddings := chunks.get()) is not None:
+                # TO_VECTOR() takes a comma-separated string
+                vector_strs = [",".join(f"{x:.6g}" for x in vector) for vector in embeddings]
+                end = start + len(vector_strs)
+                cursor.executemany(insert_query, list(zip(patient_ids[start:end], notes[start:end], vector_strs)))
+                start = end
+        except BaseException:
+            # Stop the encoding thread and empty the queue so it isn't left blocked on put()
+            stop.set()
+            while chunks.get() is not None:
+                pass
+            raise
+        # Re-raise any error from the encoding thread
+        producer.result()
 
-    cursor.executemany(insert_query, rows_list)
\ No newline at end of file
+    # Build the HNSW index once the data is loaded; Distance matches VECTOR_DOT_PRODUCT used when searching
+    create_index_query = f"CREATE INDEX NotesVectorHNSW ON {table_name} (NotesVector) AS HNSW(Distance='DotProduct', M=16, efConstruction=64)"
+    cursor.execute(create_index_query)
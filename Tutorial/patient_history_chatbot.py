@@ -3,7 +3,9 @@ from langchain_ollama import OllamaLLM
 from langchain.chains import ConversationChain
 from langchain.memory import ConversationBufferMemory
 from sentence_transformers import SentenceTransformer
+import torch
 from ..Utils.get_iris_connection import get_cursor
+from functools import lru_cache
 import logging
 import warnings
 
@@ -12,15 +14,28 @@ logging.disable(logging.CRITICAL)
 
 
 class RAGChatbot:
+    # The patient ID is a parameter, so the query text never changes and IRIS re-uses its cached plan
+    search_sql = """
+            SELECT TOP 3 ClinicalNotes 
+            FROM VectorSearch.DocRefVectors
+            WHERE PatientID = ?
+            ORDER BY VECTOR_DOT_PRODUCT(NotesVector, TO_VECTOR(?,float)) DESC
+        """
+
     def __init__(self):
         self.message_count = 0
         self.cursor = get_cursor()
         self.conversation = self.create_conversation()
         self.embedding_model = self.get_embedding_model()
+        # Remember the vectors of recent questions, so repeated questions aren't encoded again
+        self.encode_query = lru_cache(maxsize=1024)(self._encode_query)
         
 
     def get_embedding_model(self):
-        return  SentenceTransformer('all-MiniLM-L6-v2') 
+        # Half precision on GPU roughly doubles encoding speed; CPUs stay float32
+        device = "cuda" if torch.cuda.is_available() else ("mps" if torch.backends.mps.is_available() else "cpu")
+        model_kwargs = {"torch_dtype": torch.float16} if device != "cpu" else {}
+        return  SentenceTransformer('all-MiniLM-L6-v2', device=device, model_kwargs=model_kwargs) 
         
     def create_conversation(self):
         system_prompt = "You are a helpful and knowledgeable assistant designed to help a doctor interpret a patient's medical history using retrieved information from a database.\
@@ -32,16 +47,15 @@ class RAGChatbot:
         conversation = ConversationChain(llm=llm, memory=memory)
         return conversation
         
+    def _encode_query(self, user_prompt):
+        search_vector = self.embedding_model.encode(user_prompt, normalize_embeddings=True, show_progress_bar=False)
+        # Compact comma-separated string for TO_VECTOR(); shorter to send and parse than str(list)
+        return ",".join(f"{x:.6g}" for x in search_vector)
+
     def vector_search(self, user_prompt,patient):
-        search_vector =  self.embedding_model.encode(user_prompt, normalize_embeddings=True, show_progress_bar=False).tolist() 
+        search_vector = self.encode_query(user_prompt)
         
-        search_sql = f"""
-            SELECT TOP 3 ClinicalNotes 
-            FROM VectorSearch.DocRefVectors
-            WHERE PatientID = {patient}
-            ORDER BY VECTOR_COSINE(NotesVector, TO_VECTOR(?,double)) DESC
-        """
-        self.cursor.execute(search_sql,[str(search_vector)])
+        self.cursor.execute(self.search_sql,[patient, search_vector])
         
         results = self.cursor.fetchall()
         return results
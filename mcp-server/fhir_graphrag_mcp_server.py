@@ -1079,8 +1079,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
                 try:
                     # Semantic search with NV-CLIP (using cached embeddings)
                     query_vector_tuple = get_cached_embedding(query)
-                    query_vector = list(query_vector_tuple)  # Convert tuple back to list
-                    vector_str = ','.join(map(str, query_vector))
+                    vector_str = ','.join(map(str, query_vector_tuple))
                     
                     # Check if this was a cache hit
                     info = cache_info()
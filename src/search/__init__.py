@@ -2,16 +2,20 @@
 
 from .scoring import (
     calculate_similarity,
+    calculate_similarities,
     get_score_color,
     get_confidence_level,
     get_hex_color,
-    score_result
+    score_result,
+    score_results
 )
 
 __all__ = [
     'calculate_similarity',
+    'calculate_similarities',
     'get_score_color',
     'get_confidence_level',
     'get_hex_color',
-    'score_result'
+    'score_result',
+    'score_results'
 ]
@@ -7,15 +7,164 @@ to improve search performance by avoiding redundant API calls.
 
 import sys
 import os
-from functools import lru_cache
-from typing import Tuple
+import asyncio
+import hashlib
+import threading
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 # Import embedder singleton
 # Breaks circular dependency with MCP server
 from src.embeddings.embedder_singleton import get_embedder
 
 
-@lru_cache(maxsize=1000)
+# Same fields as functools.lru_cache's CacheInfo
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+CACHE_MAXSIZE = 1000
+
+# NV-CLIP embedding width; embeddings of this size are also mirrored into a
+# contiguous float32 row pool for array consumers
+EMBEDDING_DIM = 1024
+
+
+def _cache_key(query_text: str) -> bytes:
+    """
+    Fixed-size cache key for a query: 8-byte BLAKE2b digest of its UTF-8 bytes.
+
+    Keeps key hashing and collision comparisons independent of query
+    length. Accidental collisions (~2^-64) are negligible for a
+    1000-entry cache.
+    """
+    return hashlib.blake2b(query_text.encode('utf-8'), digest_size=8).digest()
+
+
+def _normalize_inplace(vector: np.ndarray) -> np.ndarray:
+    """Scale vector to unit length in place (zero vectors are left as-is)."""
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+class _LRU:
+    """
+    Minimal LRU store backed by a plain dict.
+
+    Relies on dict insertion order: a hit re-inserts the key at the end,
+    and eviction pops the first (least recently used) key. CPython dicts
+    cannot be pre-sized; warming up to 1000 entries costs only a handful
+    of resizes.
+
+    Entries of width ``dim`` additionally get a row in a single
+    ``(maxsize, dim)`` float32 array, allocated on first use and stored
+    unit-normalized. Evicted rows go back on a free list for reuse.
+    """
+
+    __slots__ = ('d', 'hits', 'misses', 'maxsize', 'lock',
+                 'dim', 'rows', 'row_of', 'free_rows')
+
+    def __init__(self, maxsize: int, dim: int):
+        self.d: Dict[bytes, Tuple[float, ...]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.dim = dim
+        self.rows: Optional[np.ndarray] = None
+        self.row_of: Dict[bytes, int] = {}
+        self.free_rows: List[int] = []
+
+    def get(self, key: bytes) -> Optional[Tuple[float, ...]]:
+        # The lookup itself is a single atomic dict read and takes no lock;
+        # counters may lose an increment under contention, which is fine
+        # for statistics.
+        value = self.d.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        # The recency update mutates the dict, so it must not race with
+        # put()'s eviction scan. Skip it rather than wait when a writer
+        # holds the lock: under contention eviction is then only
+        # approximately LRU, but hits never block.
+        if self.lock.acquire(blocking=False):
+            try:
+                # Only move the key when it is not already the most recent
+                # one. Every pop + re-insert uses up a dict entry slot and
+                # eventually forces a compaction, so repeated queries skip
+                # that churn.
+                if key in self.d and next(reversed(self.d)) != key:
+                    self.d[key] = self.d.pop(key)
+            finally:
+                self.lock.release()
+        self.hits += 1
+        return value
+
+    def put(self, key: bytes, value: Tuple[float, ...]) -> None:
+        # Writes (cache misses, which already pay for an embedder call)
+        # stay serialized so eviction and row bookkeeping remain consistent
+        with self.lock:
+            self.d[key] = value
+            if len(self.d) > self.maxsize:
+                evicted = next(iter(self.d))
+                del self.d[evicted]
+                row = self.row_of.pop(evicted, None)
+                if row is not None:
+                    self.free_rows.append(row)
+            if len(value) == self.dim and key not in self.row_of:
+                if self.rows is None:
+                    self.rows = np.empty((self.maxsize, self.dim), dtype=np.float32)
+                    self.free_rows = list(range(self.maxsize - 1, -1, -1))
+                row = self.free_rows.pop()
+                self.rows[row] = value
+                _normalize_inplace(self.rows[row])
+                self.row_of[key] = row
+
+    def get_row(self, key: bytes) -> Optional[np.ndarray]:
+        # Lock-free like get(); a row recycled after this returns is the
+        # documented view-lifetime caveat of get_cached_embedding_array()
+        row = self.row_of.get(key)
+        if row is None:
+            return None
+        view = self.rows[row]
+        view.flags.writeable = False
+        return view
+
+    def info(self) -> CacheInfo:
+        # Lock-free: each attribute read is atomic under the GIL. Under
+        # concurrent writes the counters may be from slightly different
+        # moments, which is fine for statistics.
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.d))
+
+    def clear(self) -> None:
+        with self.lock:
+            self.d.clear()
+            self.row_of.clear()
+            if self.rows is not None:
+                self.free_rows = list(range(self.maxsize - 1, -1, -1))
+            self.hits = 0
+            self.misses = 0
+
+
+_cache = _LRU(CACHE_MAXSIZE, EMBEDDING_DIM)
+
+# Embedder handle bound on the first cache miss. It is re-resolved if
+# get_embedder is rebound (e.g. patched) or had returned None.
+_embedder = None
+_embedder_source = None
+
+
+def _resolve_embedder():
+    """Return the shared embedder, calling get_embedder() only when needed."""
+    global _embedder, _embedder_source
+    if _embedder is None or _embedder_source is not get_embedder:
+        _embedder = get_embedder()
+        _embedder_source = get_embedder
+    return _embedder
+
+
 def get_cached_embedding(query_text: str) -> Tuple[float, ...]:
     """
     Get or compute embedding for query text with LRU caching.
@@ -26,21 +175,26 @@ def get_cached_embedding(query_text: str) -> Tuple[float, ...]:
     Cache behavior:
     - Max size: 1000 queries
     - Eviction: Least Recently Used (LRU)
-    - Thread-safe: functools.lru_cache is thread-safe
+    - Thread-safe: hits never wait on a lock; all dict mutations
+      (recency updates, inserts, evictions) are serialized by a lock
     
     Args:
         query_text: Natural language search query
         
     Returns:
         Tuple of floats representing the 1024-dim embedding vector.
-        Returns tuple (not list) because tuples are hashable and
-        can be used as cache keys.
+        Returns tuple (not list) so cached values are immutable.
         
     Raises:
         AttributeError: If embedder is None
         TypeError: If embedder.embed_text fails
     """
-    embedder = get_embedder()
+    key = _cache_key(query_text)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    embedder = _resolve_embedder()
     
     if embedder is None:
         raise AttributeError(
@@ -52,13 +206,72 @@ def get_cached_embedding(query_text: str) -> Tuple[float, ...]:
     # This returns a list of floats
     embedding_list = embedder.embed_text(query_text)
     
-    # Convert list to tuple for hashability
-    # (functools.lru_cache requires hashable return values)
+    # Convert list to tuple so callers cannot mutate the cached value
     embedding_tuple = tuple(embedding_list)
+    _cache.put(key, embedding_tuple)
     
     return embedding_tuple
 
 
+def get_cached_embedding_array(query_text: str) -> np.ndarray:
+    """
+    Get the cached embedding for query text as a unit-normalized float32
+    numpy array.
+
+    Because the vector is normalized once at insertion, cosine similarity
+    against other normalized vectors is a plain dot product (see
+    calculate_similarity(..., assume_normalized=True)).
+
+    For NV-CLIP sized embeddings this is a read-only view into the cache's
+    contiguous row pool, so no per-call list -> array conversion happens.
+    The view is only valid while the entry stays cached; copy it if it
+    must outlive later cache insertions.
+
+    Args:
+        query_text: Natural language search query
+
+    Returns:
+        np.ndarray: Unit-length float32 embedding vector
+    """
+    embedding = get_cached_embedding(query_text)
+    row = _cache.get_row(_cache_key(query_text))
+    if row is None:
+        return _normalize_inplace(np.array(embedding, dtype=np.float32))
+    return row
+
+
+async def get_cached_embeddings_async(
+    query_texts: List[str],
+    max_concurrency: int = 8
+) -> List[Tuple[float, ...]]:
+    """
+    Get embeddings for several queries, filling cache misses concurrently.
+    
+    Each unique query is resolved through get_cached_embedding() in a
+    worker thread, so up to ``max_concurrency`` NV-CLIP requests are in
+    flight at once instead of one after another. Duplicate queries in the
+    batch are embedded only once.
+    
+    Args:
+        query_texts: Natural language search queries
+        max_concurrency: Maximum number of simultaneous embedder calls
+        
+    Returns:
+        List of embedding tuples, in the same order as query_texts
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def fetch(query_text: str) -> Tuple[float, ...]:
+        async with semaphore:
+            return await asyncio.to_thread(get_cached_embedding, query_text)
+    
+    unique_queries = list(dict.fromkeys(query_texts))
+    embeddings = await asyncio.gather(*(fetch(q) for q in unique_queries))
+    by_query = dict(zip(unique_queries, embeddings))
+    
+    return [by_query[q] for q in query_texts]
+
+
 def cache_info():
     """
     Get cache statistics.
@@ -72,14 +285,14 @@ def cache_info():
     Returns:
         CacheInfo: Named tuple with cache statistics
     """
-    return get_cached_embedding.cache_info()
+    return _cache.info()
 
 
 def clear_cache():
     """
     Clear all cached embeddings and reset statistics.
     """
-    get_cached_embedding.cache_clear()
+    _cache.clear()
 
 
 class EmbeddingCache:
@@ -3,6 +3,9 @@ Hybrid Search Service.
 Combines FHIR text search and KG search using Reciprocal Rank Fusion (RRF).
 """
 
+import heapq
+from collections import defaultdict
+from itertools import chain
 from typing import Dict, Any
 from .base import BaseSearchService
 from .fhir_search import FHIRSearchService
@@ -33,52 +36,38 @@ class HybridSearchService(BaseSearchService):
         kg_data = self.kg_service.search_entities(query, limit=10)
         kg_results = kg_data.get("entities", [])
         
-        # 2. Map resource_id to RRF score
-        rrf_scores = {}
+        # 2. Map resource_id to RRF score in one pass over (source, rank) pairs.
+        # Note: multiple KG entities can point to the same resource; only the
+        # best (first) rank per source contributes to the score.
+        rrf_scores = defaultdict(lambda: {"fhir": 0.0, "kg": 0.0, "total": 0.0})
         document_meta = {}
         
-        # Process FHIR text results
-        for rank, result in enumerate(fhir_results, start=1):
-            fhir_id = result["fhir_id"]
-            score = 1.0 / (self.rrf_k + rank)
-            
-            if fhir_id not in rrf_scores:
-                rrf_scores[fhir_id] = {"fhir": 0.0, "kg": 0.0, "total": 0.0}
-                document_meta[fhir_id] = {
-                    "preview": result["preview"],
-                    "sources": ["fhir"]
-                }
-            
-            rrf_scores[fhir_id]["fhir"] = score
-            rrf_scores[fhir_id]["total"] += score
-
-        # Process KG entity results (entities are linked to resources)
-        # Note: multiple entities can point to same resource
-        seen_kg_resources = set()
-        for rank, entity in enumerate(kg_results, start=1):
-            fhir_id = entity["resource_id"]
+        ranked = chain(
+            (("fhir", rank, result["fhir_id"], result["preview"])
+             for rank, result in enumerate(fhir_results, start=1)),
+            (("kg", rank, entity["resource_id"], entity.get("preview", "No preview available"))
+             for rank, entity in enumerate(kg_results, start=1)),
+        )
+        
+        for source, rank, fhir_id, preview in ranked:
             if not fhir_id or fhir_id == "None":
                 continue
-                
-            score = 1.0 / (self.rrf_k + rank)
             
-            if fhir_id not in rrf_scores:
-                rrf_scores[fhir_id] = {"fhir": 0.0, "kg": 0.0, "total": 0.0}
-                document_meta[fhir_id] = {
-                    "preview": entity.get("preview", "No preview available"),
-                    "sources": ["kg"]
-                }
-            elif "kg" not in document_meta[fhir_id]["sources"]:
-                document_meta[fhir_id]["sources"].append("kg")
-                
-            if fhir_id not in seen_kg_resources:
-                rrf_scores[fhir_id]["kg"] = score
-                rrf_scores[fhir_id]["total"] += score
-                seen_kg_resources.add(fhir_id)
+            meta = document_meta.get(fhir_id)
+            if meta is None:
+                document_meta[fhir_id] = {"preview": preview, "sources": [source]}
+            elif source not in meta["sources"]:
+                meta["sources"].append(source)
+            
+            scores = rrf_scores[fhir_id]
+            if not scores[source]:
+                score = 1.0 / (self.rrf_k + rank)
+                scores[source] = score
+                scores["total"] += score
 
-        # 3. Sort by total RRF score
+        # 3. Select top_k by total RRF score (partial selection, no full sort)
         fused_results = []
-        for fhir_id, scores in sorted(rrf_scores.items(), key=lambda x: x[1]["total"], reverse=True)[:top_k]:
+        for fhir_id, scores in heapq.nlargest(top_k, rrf_scores.items(), key=lambda x: x[1]["total"]):
             meta = document_meta[fhir_id]
             fused_results.append({
                 "fhir_id": fhir_id,
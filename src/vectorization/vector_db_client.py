@@ -3,19 +3,150 @@ IRIS Vector Database Client
 
 Provides a Python wrapper for InterSystems IRIS vector database operations.
 Supports connection management, vector insertion, and similarity search using
-IRIS native VECTOR(DOUBLE, n) type with COSINE similarity.
+IRIS native VECTOR(DOUBLE | FLOAT, n) types with COSINE similarity.
 """
 
 import os
+import queue
+import asyncio
+import functools
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import logging
 
+import numpy as np
+
+# usearch is optional: it provides hand-vectorized exact cosine kernels for
+# search_similar_local(); without it the NumPy/BLAS path is used.
+try:
+    from usearch.index import search as usearch_search, MetricKind
+    USEARCH_AVAILABLE = True
+except ImportError:
+    USEARCH_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Client dtype -> IRIS VECTOR element type for ClinicalNoteVectors.
+# There is no 8-bit option: IRIS INT vector elements are 64-bit, so a
+# quantized INT vector would lose precision without saving any space.
+VECTOR_DTYPES = {
+    "double": "DOUBLE",
+    "float": "FLOAT",
+}
+
+# Idle IRIS connections shared by pool_enabled clients, keyed on
+# (host, port, namespace, username)
+_POOL: Dict[tuple, queue.Queue] = {}
+
+
+def _format_vector(embedding: Any) -> str:
+    """
+    Format an embedding (list, tuple or ndarray) as a TO_VECTOR text literal.
+
+    IRIS TO_VECTOR() only takes text input, so there is no binary binding
+    to use. Going through one float64 array turns any input, including numpy
+    arrays or lists of numpy scalars, into plain Python floats. repr() of a
+    Python float is the shortest round-trip text and is cheaper per element
+    than str() (and much cheaper than str() of a numpy scalar).
+    """
+    values = np.asarray(embedding, dtype=np.float64).tolist()
+    return "[" + ",".join(map(repr, values)) + "]"
+
+
+def _parse_vector(value: Any) -> np.ndarray:
+    """Convert a fetched VECTOR value ("0.1,0.2,..." text or a sequence) to float32."""
+    if isinstance(value, str):
+        return np.fromstring(value.strip("[]"), dtype=np.float32, sep=",")
+    return np.asarray(value, dtype=np.float32)
+
+
+def _top_k_cosine(matrix: np.ndarray, query: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact top-k cosine similarity of query against every row of matrix.
+
+    Returns (row indices, similarities), best first.
+    """
+    top_k = min(top_k, len(matrix))
+    if top_k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    if USEARCH_AVAILABLE:
+        matches = usearch_search(matrix, query, top_k, MetricKind.Cos, exact=True)
+        return np.asarray(matches.keys, dtype=np.int64), 1.0 - np.asarray(matches.distances)
+
+    # One matrix-vector product (BLAS sgemv) scores all rows at once
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    scores = matrix @ query
+    np.divide(scores, norms, out=scores, where=norms > 0)
+    scores[norms == 0] = 0.0
+
+    top = np.argpartition(-scores, top_k - 1)[:top_k]
+    top = top[np.argsort(-scores[top], kind="stable")]
+    return top, scores[top]
+
+
+# Result columns returned by the two similarity searches (Similarity follows)
+_CLINICAL_NOTE_COLUMNS = ("ResourceID", "PatientID", "DocumentType", "TextContent", "SourceBundle")
+_IMAGE_COLUMNS = ("ImageID", "PatientID", "StudyType", "ImagePath", "RelatedReportID")
+
+
+# SQL builders are memoized only to skip the per-call string formatting. Plan
+# reuse comes from binding every value (vectors included) as a parameter, so
+# the statement text IRIS keys its cached queries on stays the same per shape.
+@functools.lru_cache(maxsize=64)
+def _clinical_note_insert_sql(
+    full_table_name: str,
+    vector_type: str = "DOUBLE"
+) -> str:
+    """INSERT statement for one ClinicalNoteVectors row (7 parameters)."""
+    return f"""
+            INSERT INTO {full_table_name} (
+                ResourceID,
+                PatientID,
+                DocumentType,
+                TextContent,
+                SourceBundle,
+                Embedding,
+                EmbeddingModel
+            ) VALUES (?, ?, ?, ?, ?, TO_VECTOR(?, {vector_type}), ?)
+            """
+
+
+@functools.lru_cache(maxsize=64)
+def _similarity_search_sql(
+    full_table_name: str,
+    vector_type: str,
+    top_k: int,
+    columns: Tuple[str, ...],
+    filter_columns: Tuple[str, ...] = ()
+) -> str:
+    """
+    TOP-k COSINE search statement.
+
+    Parameters, in order: query vector, then one value per filter column.
+    VECTOR_COSINE returns similarity (0-1, higher is better). Ordering by
+    the Similarity alias means the query vector is bound and converted
+    once per search; TOP n ... ORDER BY a VECTOR_COSINE DESC is still
+    the shape IRIS serves from an HNSW index on Embedding.
+    """
+    where_sql = ""
+    if filter_columns:
+        where_sql = "WHERE " + " AND ".join(f"{column} = ?" for column in filter_columns)
+
+    select_columns = ",\n            ".join(columns)
+    return f"""
+        SELECT TOP {top_k}
+            {select_columns},
+            VECTOR_COSINE(Embedding, TO_VECTOR(?, {vector_type})) AS Similarity
+        FROM {full_table_name}
+        {where_sql}
+        ORDER BY Similarity DESC
+        """
+
+
 class IRISVectorDBClient:
     """
     Client for InterSystems IRIS vector database operations.
@@ -31,17 +162,36 @@ class IRISVectorDBClient:
         namespace: str = "DEMO",
         username: str = "_SYSTEM",
         password: str = "SYS",
-        vector_dimension: int = 1024
+        vector_dimension: int = 1024,
+        dtype: str = "double",
+        pool_enabled: bool = False
     ):
         """
         Initialize IRIS database client.
+
+        ``dtype`` selects how ClinicalNoteVectors embeddings are stored:
+        "double" (8 bytes/element) or "float" (4).
+        Image vector tables always use DOUBLE.
+
+        With ``pool_enabled``, disconnect() hands the connection back to a
+        module-level pool instead of closing it, and connect() reuses an
+        idle pooled connection for the same host/port/namespace/user
+        before opening a new one.
         """
+        if dtype not in VECTOR_DTYPES:
+            raise ValueError(
+                f"Unsupported vector dtype {dtype!r}; expected one of {sorted(VECTOR_DTYPES)}"
+            )
+
         self.host = host
         self.port = port
         self.namespace = namespace
         self.username = username
         self.password = password
         self.vector_dimension = vector_dimension
+        self.dtype = dtype
+        self.vector_type = VECTOR_DTYPES[dtype]
+        self.pool_enabled = pool_enabled
 
         self.connection = None
         self.cursor = None
@@ -54,7 +204,11 @@ class IRISVectorDBClient:
         """
         try:
             from src.db.connection import DatabaseConnection
-            
+
+            if self.pool_enabled and self._reuse_pooled_connection():
+                logger.info(f"✓ Reused pooled IRIS connection: {self.host}:{self.port}/{self.namespace}")
+                return
+
             self.connection = DatabaseConnection.get_connection(
                 hostname=self.host,
                 port=self.port,
@@ -73,14 +227,85 @@ class IRISVectorDBClient:
             logger.error(f"✗ Failed to connect to IRIS: {e}")
             raise
 
+    def _reuse_pooled_connection(self) -> bool:
+        """
+        Borrow an idle pooled connection, skipping any that have gone stale.
+
+        Each candidate is checked with a cheap ``SELECT 1`` first; dead ones
+        are closed and dropped. Returns False when no live connection is idle.
+        """
+        pool = _POOL.get(self._pool_key())
+        while pool is not None:
+            try:
+                connection = pool.get_nowait()
+            except queue.Empty:
+                return False
+            try:
+                cursor = connection.cursor()
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            except Exception as e:
+                logger.warning(f"Discarding stale pooled IRIS connection: {e}")
+                self._close_quietly(connection)
+                continue
+            self.connection = connection
+            self.cursor = cursor
+            return True
+        return False
+
+    @staticmethod
+    def _close_quietly(connection) -> None:
+        """Close a connection that may already be dead, ignoring errors."""
+        try:
+            connection.close()
+        except Exception:
+            pass
+
     def disconnect(self) -> None:
-        """Close database connection."""
-        if self.cursor:
-            self.cursor.close()
-        if self.connection:
-            self.connection.close()
+        """Close database connection (or return it to the pool)."""
+        connection, cursor = self.connection, self.cursor
+        self.connection = None
+        self.cursor = None
+        # Never raise from here: disconnect() runs from __exit__ and must not
+        # replace an error raised in the with-body
+        if cursor:
+            try:
+                cursor.close()
+            except Exception as e:
+                logger.warning(f"Failed to close IRIS cursor: {e}")
+        if connection and self.pool_enabled:
+            # Drop any open transaction so the next borrower starts clean
+            try:
+                connection.rollback()
+            except Exception as e:
+                logger.warning(f"Discarding IRIS connection that failed to roll back: {e}")
+                self._close_quietly(connection)
+                return
+            _POOL.setdefault(self._pool_key(), queue.Queue()).put(connection)
+            logger.info("✓ Returned IRIS connection to pool")
+        elif connection:
+            self._close_quietly(connection)
             logger.info("✓ Disconnected from IRIS")
 
+    def _pool_key(self) -> tuple:
+        """Pool bucket for this client's connection settings."""
+        return (self.host, self.port, self.namespace, self.username)
+
+    @classmethod
+    def close_pool(cls) -> None:
+        """Close every idle pooled connection and empty the pool."""
+        for pool in _POOL.values():
+            while True:
+                try:
+                    connection = pool.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    connection.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close pooled connection: {e}")
+        _POOL.clear()
+
     def __enter__(self):
         """Context manager entry."""
         self.connect()
@@ -90,6 +315,27 @@ class IRISVectorDBClient:
         """Context manager exit."""
         self.disconnect()
 
+    def _clinical_note_row(
+        self,
+        resource_id: str,
+        patient_id: str,
+        document_type: str,
+        text_content: str,
+        source_bundle: Optional[str],
+        embedding: List[float],
+        embedding_model: str
+    ) -> Tuple:
+        """Parameter tuple matching _clinical_note_insert_sql()."""
+        return (
+            resource_id,
+            patient_id,
+            document_type,
+            text_content,
+            source_bundle,
+            _format_vector(embedding),
+            embedding_model
+        )
+
     def _get_full_table_name(self, table_name: str) -> str:
         """
         Get fully qualified table name.
@@ -103,10 +349,19 @@ class IRISVectorDBClient:
     def create_clinical_note_vectors_table(
         self,
         table_name: str = "ClinicalNoteVectors",
-        drop_if_exists: bool = False
+        drop_if_exists: bool = False,
+        hnsw_index: bool = True,
+        hnsw_m: int = 16,
+        hnsw_ef_construction: int = 64
     ) -> None:
         """
         Create the ClinicalNoteVectors table with VECTOR column.
+
+        By default an HNSW index is built on the Embedding column so that
+        search_similar() is answered by approximate nearest-neighbour
+        lookup instead of a full COSINE scan of the table. The index is
+        built after the table is committed; if it fails, a warning is
+        logged and the table is kept.
         """
         if not self.connection:
             self.connect()
@@ -129,7 +384,7 @@ class IRISVectorDBClient:
                 DocumentType VARCHAR(255) NOT NULL,
                 TextContent VARCHAR(32000),
                 SourceBundle VARCHAR(500),
-                Embedding VECTOR(DOUBLE, {self.vector_dimension}) NOT NULL,
+                Embedding VECTOR({self.vector_type}, {self.vector_dimension}) NOT NULL,
                 EmbeddingModel VARCHAR(100) NOT NULL,
                 CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 UpdatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -140,13 +395,31 @@ class IRISVectorDBClient:
             self.connection.commit()
 
             logger.info(f"✓ Created table: {full_table_name}")
-            logger.info(f"  Vector dimension: {self.vector_dimension}")
+            logger.info(f"  Vector dimension: {self.vector_dimension} ({self.dtype})")
             logger.info(f"  Similarity metric: COSINE")
 
         except Exception as e:
             logger.error(f"✗ Failed to create table: {e}")
             raise
 
+        if hnsw_index:
+            # The index is an optimization: if it cannot be built (IRIS
+            # version without HNSW, name already taken) the table is still
+            # usable and searches fall back to a full COSINE scan.
+            # Index names cannot be schema-qualified.
+            index_name = full_table_name.split(".")[-1] + "HNSW"
+            index_sql = f"""
+            CREATE INDEX {index_name} ON {full_table_name} (Embedding)
+            AS HNSW(Distance='Cosine', M={int(hnsw_m)}, efConstruction={int(hnsw_ef_construction)})
+            """
+            try:
+                self.cursor.execute(index_sql)
+                self.connection.commit()
+                logger.info(f"  HNSW index: M={hnsw_m}, efConstruction={hnsw_ef_construction}")
+            except Exception as e:
+                self.connection.rollback()
+                logger.warning(f"HNSW index not created on {full_table_name}: {e}")
+
     def insert_vector(
         self,
         resource_id: str,
@@ -174,31 +447,16 @@ class IRISVectorDBClient:
 
         full_table_name = self._get_full_table_name(table_name)
 
-        # Convert vector to VECTOR literal format
-        vector_str = "[" + ",".join(map(str, embedding)) + "]"
-
         try:
-            insert_sql = f"""
-            INSERT INTO {full_table_name} (
-                ResourceID,
-                PatientID,
-                DocumentType,
-                TextContent,
-                SourceBundle,
-                Embedding,
-                EmbeddingModel
-            ) VALUES (?, ?, ?, ?, ?, TO_VECTOR(?, DOUBLE), ?)
-            """
-
             self.cursor.execute(
-                insert_sql,
-                (
+                _clinical_note_insert_sql(full_table_name, self.vector_type),
+                self._clinical_note_row(
                     resource_id,
                     patient_id,
                     document_type,
                     text_content,
                     source_bundle,
-                    vector_str,
+                    embedding,
                     embedding_model
                 )
             )
@@ -209,6 +467,18 @@ class IRISVectorDBClient:
             logger.error(f"✗ Failed to insert vector for {resource_id}: {e}")
             raise
 
+    def _check_batch_dimensions(self, vectors: List[Dict[str, Any]]) -> None:
+        """Raise ValueError if any embedding in the batch has the wrong dimension."""
+        # A len() per row is all that is needed; building an array of the
+        # whole batch just to read its shape costs far more on this path
+        for vector_data in vectors:
+            embedding = vector_data["embedding"]
+            if len(embedding) != self.vector_dimension:
+                raise ValueError(
+                    f"Vector dimension mismatch for {vector_data.get('resource_id')}: "
+                    f"expected {self.vector_dimension}, got {len(embedding)}"
+                )
+
     def insert_vectors_batch(
         self,
         vectors: List[Dict[str, Any]],
@@ -216,11 +486,51 @@ class IRISVectorDBClient:
     ) -> Tuple[int, int]:
         """
         Insert multiple vectors in a batch.
+
+        All rows are sent with a single executemany() and one commit. If
+        that fails (e.g. a duplicate key), the batch is rolled back and
+        retried row by row so the good rows still land and the
+        (success_count, failed_count) split is reported.
+
+        Raises:
+            ValueError: If any embedding has the wrong dimension; checked
+                before anything is sent to the database.
         """
         if not self.connection:
             self.connect()
         assert self.cursor is not None
 
+        if not vectors:
+            return 0, 0
+
+        self._check_batch_dimensions(vectors)
+
+        full_table_name = self._get_full_table_name(table_name)
+
+        params = [
+            self._clinical_note_row(
+                vector_data["resource_id"],
+                vector_data["patient_id"],
+                vector_data["document_type"],
+                vector_data["text_content"],
+                vector_data.get("source_bundle"),
+                vector_data["embedding"],
+                vector_data["embedding_model"]
+            )
+            for vector_data in vectors
+        ]
+        insert_sql = _clinical_note_insert_sql(full_table_name, self.vector_type)
+
+        try:
+            self.cursor.executemany(insert_sql, params)
+            self.connection.commit()
+            logger.info(f"✓ Batch insert: {len(vectors)} successful, 0 failed")
+            return len(vectors), 0
+
+        except Exception as e:
+            logger.warning(f"Batch insert failed, retrying row by row: {e}")
+            self.connection.rollback()
+
         success_count = 0
         failed_count = 0
 
@@ -245,6 +555,61 @@ class IRISVectorDBClient:
         logger.info(f"✓ Batch insert: {success_count} successful, {failed_count} failed")
         return success_count, failed_count
 
+    async def insert_vectors_batch_async(
+        self,
+        vectors: List[Dict[str, Any]],
+        table_name: str = "ClinicalNoteVectors",
+        concurrency: int = 4,
+        chunk_size: int = 1000
+    ) -> Tuple[int, int]:
+        """
+        Insert a large batch as concurrent chunks on separate connections.
+
+        The batch is split into ``chunk_size`` slices; each slice is written
+        with insert_vectors_batch() by its own client/connection in a worker
+        thread, with at most ``concurrency`` slices in flight. Pooled
+        connections are reused when this client has pool_enabled.
+
+        Raises:
+            ValueError: If any embedding has the wrong dimension; checked
+                for the whole batch before any chunk is written.
+        """
+        if not vectors:
+            return 0, 0
+
+        self._check_batch_dimensions(vectors)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        def insert_chunk(chunk: List[Dict[str, Any]]) -> Tuple[int, int]:
+            worker = IRISVectorDBClient(
+                host=self.host,
+                port=self.port,
+                namespace=self.namespace,
+                username=self.username,
+                password=self.password,
+                vector_dimension=self.vector_dimension,
+                dtype=self.dtype,
+                pool_enabled=self.pool_enabled
+            )
+            with worker:
+                return worker.insert_vectors_batch(chunk, table_name)
+
+        async def run(chunk: List[Dict[str, Any]]) -> Tuple[int, int]:
+            async with semaphore:
+                return await asyncio.to_thread(insert_chunk, chunk)
+
+        chunks = [vectors[i:i + chunk_size] for i in range(0, len(vectors), chunk_size)]
+        counts = await asyncio.gather(*(run(chunk) for chunk in chunks))
+
+        success_count = sum(success for success, _ in counts)
+        failed_count = sum(failed for _, failed in counts)
+        logger.info(
+            f"✓ Async batch insert: {success_count} successful, {failed_count} failed "
+            f"({len(chunks)} chunks)"
+        )
+        return success_count, failed_count
+
     def search_similar(
         self,
         query_vector: List[float],
@@ -255,6 +620,9 @@ class IRISVectorDBClient:
     ) -> List[Dict[str, Any]]:
         """
         Search for similar vectors using COSINE similarity.
+
+        The query is shaped as TOP n ... ORDER BY <VECTOR_COSINE alias> DESC
+        so the IRIS planner can serve it from the table's HNSW index.
         """
         if not self.connection:
             self.connect()
@@ -270,9 +638,80 @@ class IRISVectorDBClient:
         full_table_name = self._get_full_table_name(table_name)
 
         # Convert query vector to VECTOR literal
-        vector_str = "[" + ",".join(map(str, query_vector)) + "]"
+        vector_str = _format_vector(query_vector)
+
+        # Build query with optional filters. The query vector is bound as a
+        # parameter so the statement text stays the same across queries.
+        filter_columns = []
+        params = [vector_str]
+
+        if patient_id:
+            filter_columns.append("PatientID")
+            params.append(patient_id)
+
+        if document_type:
+            filter_columns.append("DocumentType")
+            params.append(document_type)
+
+        search_sql = _similarity_search_sql(
+            full_table_name,
+            self.vector_type,
+            int(top_k),
+            _CLINICAL_NOTE_COLUMNS,
+            tuple(filter_columns)
+        )
+
+        try:
+            self.cursor.execute(search_sql, params)
+
+            results = []
+            for row in self.cursor.fetchall():
+                results.append({
+                    "resource_id": row[0],
+                    "patient_id": row[1],
+                    "document_type": row[2],
+                    "text_content": row[3],
+                    "source_bundle": row[4],
+                    "similarity": float(row[5])
+                })
+
+            logger.info(f"✓ Found {len(results)} similar vectors (top {top_k})")
+            return results
+
+        except Exception as e:
+            logger.error(f"✗ Vector search failed: {e}")
+            raise
+
+    def search_similar_local(
+        self,
+        query_vector: List[float],
+        top_k: int = 10,
+        patient_id: Optional[str] = None,
+        document_type: Optional[str] = None,
+        table_name: str = "ClinicalNoteVectors"
+    ) -> List[Dict[str, Any]]:
+        """
+        Exact COSINE search computed client-side.
+
+        Fetches the (optionally filtered) candidate rows once and scores
+        them as a single float32 matrix with NumPy, or with usearch's SIMD
+        kernels when it is installed. Meant for small tables or narrow
+        filters where an HNSW index is missing or not worth using; returns
+        the same result dicts as search_similar().
+        """
+        if not self.connection:
+            self.connect()
+        assert self.cursor is not None
+
+        # Validate vector dimension
+        if len(query_vector) != self.vector_dimension:
+            raise ValueError(
+                f"Query vector dimension mismatch: expected {self.vector_dimension}, "
+                f"got {len(query_vector)}"
+            )
+
+        full_table_name = self._get_full_table_name(table_name)
 
-        # Build query with optional filters
         where_clauses = []
         params = []
 
@@ -288,42 +727,50 @@ class IRISVectorDBClient:
         if where_clauses:
             where_sql = "WHERE " + " AND ".join(where_clauses)
 
-        # VECTOR_COSINE returns similarity (0-1, higher is better)
-        search_sql = f"""
-        SELECT TOP {top_k}
+        candidates_sql = f"""
+        SELECT
             ResourceID,
             PatientID,
             DocumentType,
             TextContent,
             SourceBundle,
-            VECTOR_COSINE(Embedding, TO_VECTOR('{vector_str}', DOUBLE)) AS Similarity
+            Embedding
         FROM {full_table_name}
         {where_sql}
-        ORDER BY Similarity DESC
         """
 
         try:
-            if params:
-                self.cursor.execute(search_sql, params)
-            else:
-                self.cursor.execute(search_sql)
+            self.cursor.execute(candidates_sql, params)
+            rows = self.cursor.fetchall()
+
+            if not rows:
+                logger.info("✓ Found 0 similar vectors (no candidates)")
+                return []
+
+            matrix = np.empty((len(rows), self.vector_dimension), dtype=np.float32)
+            for i, row in enumerate(rows):
+                matrix[i] = _parse_vector(row[5])
+            query = np.asarray(query_vector, dtype=np.float32)
+
+            indices, similarities = _top_k_cosine(matrix, query, top_k)
 
             results = []
-            for row in self.cursor.fetchall():
+            for i, similarity in zip(indices, similarities):
+                row = rows[i]
                 results.append({
                     "resource_id": row[0],
                     "patient_id": row[1],
                     "document_type": row[2],
                     "text_content": row[3],
                     "source_bundle": row[4],
-                    "similarity": float(row[5])
+                    "similarity": float(similarity)
                 })
 
-            logger.info(f"✓ Found {len(results)} similar vectors (top {top_k})")
+            logger.info(f"✓ Found {len(results)} similar vectors locally (top {top_k} of {len(rows)})")
             return results
 
         except Exception as e:
-            logger.error(f"✗ Vector search failed: {e}")
+            logger.error(f"✗ Local vector search failed: {e}")
             raise
 
     def count_vectors(self, table_name: str = "ClinicalNoteVectors") -> int:
@@ -361,26 +808,30 @@ class IRISVectorDBClient:
         full_table_name = self._get_full_table_name(table_name)
 
         try:
-            # Total vectors
-            total = self.count_vectors(table_name)
-
-            # Unique patients
-            self.cursor.execute(
-                f"SELECT COUNT(DISTINCT PatientID) FROM {full_table_name}"
-            )
-            unique_patients = int(self.cursor.fetchone()[0])
-
-            # Document type breakdown
+            # One round trip, one statement: the distinct-patient count and
+            # the per-type counts come back as rows tagged by Kind; the
+            # total is the sum of the per-type counts (DocumentType is
+            # NOT NULL, so every row is in exactly one group)
             self.cursor.execute(f"""
-                SELECT DocumentType, COUNT(*) as count
+                SELECT 'patients' AS Kind, NULL AS DocumentType, COUNT(DISTINCT PatientID) AS count
+                FROM {full_table_name}
+                UNION ALL
+                SELECT 'type' AS Kind, DocumentType, COUNT(*) AS count
                 FROM {full_table_name}
                 GROUP BY DocumentType
-                ORDER BY count DESC
             """)
 
-            doc_type_counts = {}
-            for row in self.cursor.fetchall():
-                doc_type_counts[row[0]] = int(row[1])
+            unique_patients = 0
+            type_rows = []
+            for kind, doc_type, count in self.cursor.fetchall():
+                if kind == "patients":
+                    unique_patients = int(count)
+                else:
+                    type_rows.append((doc_type, int(count)))
+
+            type_rows.sort(key=lambda row: row[1], reverse=True)
+            doc_type_counts = dict(type_rows)
+            total = sum(doc_type_counts.values())
 
             stats = {
                 "total_vectors": total,
@@ -424,7 +875,7 @@ class IRISVectorDBClient:
 
         # Convert vector to VECTOR literal format
         # IRIS expects: TO_VECTOR('[0.1,0.2,0.3,...]', DOUBLE)
-        vector_str = "[" + ",".join(map(str, embedding)) + "]"
+        vector_str = _format_vector(embedding)
 
         try:
             insert_sql = f"""
@@ -481,43 +932,31 @@ class IRISVectorDBClient:
         full_table_name = self._get_full_table_name(table_name)
 
         # Convert query vector to VECTOR literal
-        vector_str = "[" + ",".join(map(str, query_vector)) + "]"
+        vector_str = _format_vector(query_vector)
 
-        # Build query with optional filters
-        where_clauses = []
-        params = []
+        # Build query with optional filters; the query vector is bound
+        # rather than inlined so the statement text is reusable
+        filter_columns = []
+        params = [vector_str]
 
         if patient_id:
-            where_clauses.append("PatientID = ?")
+            filter_columns.append("PatientID")
             params.append(patient_id)
 
         if study_type:
-            where_clauses.append("StudyType = ?")
+            filter_columns.append("StudyType")
             params.append(study_type)
 
-        where_sql = ""
-        if where_clauses:
-            where_sql = "WHERE " + " AND ".join(where_clauses)
-
-        # VECTOR_COSINE returns similarity (0-1, higher is better)
-        search_sql = f"""
-        SELECT TOP {top_k}
-            ImageID,
-            PatientID,
-            StudyType,
-            ImagePath,
-            RelatedReportID,
-            VECTOR_COSINE(Embedding, TO_VECTOR('{vector_str}', DOUBLE)) AS Similarity
-        FROM {full_table_name}
-        {where_sql}
-        ORDER BY Similarity DESC
-        """
+        search_sql = _similarity_search_sql(
+            full_table_name,
+            "DOUBLE",
+            int(top_k),
+            _IMAGE_COLUMNS,
+            tuple(filter_columns)
+        )
 
         try:
-            if params:
-                self.cursor.execute(search_sql, params)
-            else:
-                self.cursor.execute(search_sql)
+            self.cursor.execute(search_sql, params)
 
             results = []
             for row in self.cursor.fetchall():
@@ -538,6 +977,67 @@ class IRISVectorDBClient:
             raise
 
 
+class AsyncIRISVectorDBClient:
+    """
+    asyncio front end for IRISVectorDBClient.
+
+    Each operation runs the blocking driver call in a worker thread via
+    asyncio.to_thread, so an ingest pipeline can keep embedding requests in
+    flight while a commit is pending. A DB-API connection must not be used
+    from two threads at once, so calls on one client are serialized; use
+    insert_vectors_batch() (which fans out over separate connections) or
+    several clients for parallel writes.
+
+    Accepts the same keyword arguments as IRISVectorDBClient.
+    """
+
+    def __init__(self, **kwargs):
+        self.client = IRISVectorDBClient(**kwargs)
+        self._lock = asyncio.Lock()
+
+    async def _run(self, method, *args, **kwargs):
+        async with self._lock:
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+    async def connect(self) -> None:
+        """Establish connection to IRIS."""
+        await self._run(self.client.connect)
+
+    async def disconnect(self) -> None:
+        """Close (or return to the pool) the IRIS connection."""
+        await self._run(self.client.disconnect)
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.disconnect()
+
+    async def insert_vector(self, *args, **kwargs) -> None:
+        """See IRISVectorDBClient.insert_vector."""
+        await self._run(self.client.insert_vector, *args, **kwargs)
+
+    async def insert_vectors_batch(self, *args, **kwargs) -> Tuple[int, int]:
+        """See IRISVectorDBClient.insert_vectors_batch_async."""
+        # Uses its own worker connections, so it does not take the lock
+        return await self.client.insert_vectors_batch_async(*args, **kwargs)
+
+    async def search_similar(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        """See IRISVectorDBClient.search_similar."""
+        return await self._run(self.client.search_similar, *args, **kwargs)
+
+    async def count_vectors(self, *args, **kwargs) -> int:
+        """See IRISVectorDBClient.count_vectors."""
+        return await self._run(self.client.count_vectors, *args, **kwargs)
+
+    async def get_vector_stats(self, *args, **kwargs) -> Dict[str, Any]:
+        """See IRISVectorDBClient.get_vector_stats."""
+        return await self._run(self.client.get_vector_stats, *args, **kwargs)
+
+
 # Example usage
 if __name__ == "__main__":
     # Example: Connect and query
@@ -9,6 +9,7 @@ import sys
 import os
 import time
 import json
+import logging
 
 # Add project root to path
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -16,54 +17,104 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 import iris
+import pytest
 from src.query.fhir_graphrag_query import FHIRGraphRAGQuery
 from src.query.fhir_simple_query import FHIRSimpleQuery
 
+logger = logging.getLogger(__name__)
+
+# Search method -> (top_k, score log format)
+SEARCH_METHODS = {
+    "vector": (10, "%.4f"),
+    "text": (30, "%.1f"),
+    "graph": (10, "%.1f"),
+}
+
+# Embedding model shared by every FHIRGraphRAGQuery created in this process
+_MODEL_CACHE = {}
+_original_initialize_components = FHIRGraphRAGQuery.initialize_components
+
+
+def _initialize_components_cached(self, load_embedding_model=True):
+    """initialize_components that loads the SentenceTransformer only once."""
+    if load_embedding_model and 'st' not in _MODEL_CACHE:
+        _original_initialize_components(self, load_embedding_model=True)
+        _MODEL_CACHE['st'] = self.embedding_model
+        return
+
+    _original_initialize_components(self, load_embedding_model=False)
+    if load_embedding_model:
+        self.embedding_model = _MODEL_CACHE['st']
+
 
 class IntegrationTestSuite:
     """Integration test suite for GraphRAG implementation."""
 
-    def __init__(self):
+    # Number of entity types listed individually in the knowledge graph check
+    ENTITY_TYPE_HISTOGRAM_SIZE = 20
+
+    def __init__(self, record_details=False):
         self.connection = None
         self.cursor = None
         self.tests_passed = 0
         self.tests_failed = 0
+        # Failures are always recorded for the summary; passing results only
+        # when structured output (e.g. a JUnit-style report) is wanted.
+        self.record_details = record_details
         self.test_results = []
 
     def connect_database(self):
         """Connect to IRIS database."""
-        print("\n" + "="*80)
-        print("FHIR GraphRAG Integration Tests")
-        print("="*80)
-        print("\n[SETUP] Connecting to IRIS database...")
+        logger.info("\n%s", "=" * 80)
+        logger.info("FHIR GraphRAG Integration Tests")
+        logger.info("=" * 80)
+        logger.info("\n[SETUP] Connecting to IRIS database...")
 
         try:
             self.connection = iris.connect('localhost', 32782, 'DEMO', '_SYSTEM', 'ISCDEMO')
             self.cursor = self.connection.cursor()
-            print("[SETUP] ✅ Connected to IRIS")
+            self.cursor.arraysize = 256
+            logger.info("[SETUP] ✅ Connected to IRIS")
             return True
         except Exception as e:
-            print(f"[SETUP] ❌ Database connection failed: {e}")
+            logger.error("[SETUP] ❌ Database connection failed: %s", e)
             return False
 
+    def ensure_indexes(self):
+        """Create the (ResourceType, ID) index used by the FHIR sample lookups.
+
+        IRIS has no partial indexes, so a composite index stands in for a
+        DocumentReference-only one. The FHIR storage tables may reject DDL;
+        in that case the tests fall back to a scan.
+        """
+        try:
+            self.cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_rsrc_type_id "
+                "ON HSFHIR_X0001_R.Rsrc(ResourceType, ID)"
+            )
+            self.connection.commit()
+        except Exception as e:
+            logger.debug("[SETUP] Could not create Rsrc(ResourceType, ID) index: %s", e)
+
     def run_test(self, test_name, test_func):
         """Run a single test and track results."""
-        print(f"\n[TEST] {test_name}")
+        logger.info("\n[TEST] %s", test_name)
+        start = time.perf_counter_ns()
         try:
-            start = time.time()
             result = test_func()
-            elapsed = time.time() - start
+            elapsed = (time.perf_counter_ns() - start) / 1e9
 
             if result:
-                print(f"[PASS] ✅ {test_name} ({elapsed:.3f}s)")
+                logger.info("[PASS] ✅ %s (%.3fs)", test_name, elapsed)
                 self.tests_passed += 1
-                self.test_results.append({
-                    'test': test_name,
-                    'status': 'PASS',
-                    'time': elapsed
-                })
+                if self.record_details:
+                    self.test_results.append({
+                        'test': test_name,
+                        'status': 'PASS',
+                        'time': elapsed
+                    })
             else:
-                print(f"[FAIL] ❌ {test_name}")
+                logger.warning("[FAIL] ❌ %s", test_name)
                 self.tests_failed += 1
                 self.test_results.append({
                     'test': test_name,
@@ -71,8 +122,8 @@ class IntegrationTestSuite:
                     'time': elapsed
                 })
         except Exception as e:
-            elapsed = time.time() - start
-            print(f"[FAIL] ❌ {test_name} - Exception: {e}")
+            elapsed = (time.perf_counter_ns() - start) / 1e9
+            logger.warning("[FAIL] ❌ %s - Exception: %s", test_name, e)
             self.tests_failed += 1
             self.test_results.append({
                 'test': test_name,
@@ -84,7 +135,7 @@ class IntegrationTestSuite:
     # ========== Test 1: Database Schema ==========
     def test_database_schema(self):
         """Verify all required tables exist."""
-        print("  Checking tables...")
+        logger.debug("  Checking tables...")
 
         required_tables = [
             ('HSFHIR_X0001_R', 'Rsrc'),
@@ -96,10 +147,10 @@ class IntegrationTestSuite:
         for schema, table in required_tables:
             self.cursor.execute(f"SELECT COUNT(*) FROM {schema}.{table}")
             count = self.cursor.fetchone()[0]
-            print(f"    {schema}.{table}: {count} rows")
+            logger.debug("    %s.%s: %s rows", schema, table, count)
 
             if count == 0 and table != 'EntityRelationships':
-                print(f"    ⚠️  {schema}.{table} is empty!")
+                logger.debug("    ⚠️  %s.%s is empty!", schema, table)
                 return False
 
         return True
@@ -107,7 +158,7 @@ class IntegrationTestSuite:
     # ========== Test 2: FHIR Data Integrity ==========
     def test_fhir_data_integrity(self):
         """Verify FHIR data is accessible and valid."""
-        print("  Checking FHIR DocumentReference resources...")
+        logger.debug("  Checking FHIR DocumentReference resources...")
 
         self.cursor.execute("""
             SELECT COUNT(*) FROM HSFHIR_X0001_R.Rsrc
@@ -115,33 +166,35 @@ class IntegrationTestSuite:
             AND (Deleted = 0 OR Deleted IS NULL)
         """)
         doc_count = self.cursor.fetchone()[0]
-        print(f"    DocumentReference count: {doc_count}")
+        logger.debug("    DocumentReference count: %s", doc_count)
 
         if doc_count == 0:
-            print("    ❌ No DocumentReference resources found!")
+            logger.warning("    ❌ No DocumentReference resources found!")
             return False
 
         # Check that we can parse FHIR JSON
         self.cursor.execute("""
             SELECT TOP 1 ResourceString FROM HSFHIR_X0001_R.Rsrc
             WHERE ResourceType = 'DocumentReference'
+            AND (Deleted = 0 OR Deleted IS NULL)
+            ORDER BY ID
         """)
         resource_string = self.cursor.fetchone()[0]
 
         try:
             fhir_json = json.loads(resource_string)
-            print(f"    ✅ FHIR JSON parseable")
+            logger.debug("    ✅ FHIR JSON parseable")
 
             # Check for hex-encoded clinical note
             if "content" in fhir_json and len(fhir_json["content"]) > 0:
                 hex_data = fhir_json["content"][0].get("attachment", {}).get("data")
                 if hex_data:
                     decoded = bytes.fromhex(hex_data).decode('utf-8', errors='replace')
-                    print(f"    ✅ Clinical note decodable ({len(decoded)} chars)")
+                    logger.debug("    ✅ Clinical note decodable (%s chars)", len(decoded))
                 else:
-                    print(f"    ⚠️  No clinical note data found")
+                    logger.debug("    ⚠️  No clinical note data found")
         except Exception as e:
-            print(f"    ❌ FHIR JSON parsing failed: {e}")
+            logger.warning("    ❌ FHIR JSON parsing failed: %s", e)
             return False
 
         return True
@@ -149,7 +202,7 @@ class IntegrationTestSuite:
     # ========== Test 3: Vector Table Populated ==========
     def test_vector_table_populated(self):
         """Verify vectors are created for DocumentReferences."""
-        print("  Checking vector table...")
+        logger.debug("  Checking vector table...")
 
         self.cursor.execute("""
             SELECT COUNT(*) FROM VectorSearch.FHIRResourceVectors v
@@ -157,124 +210,88 @@ class IntegrationTestSuite:
             WHERE r.ResourceType = 'DocumentReference'
         """)
         vector_count = self.cursor.fetchone()[0]
-        print(f"    Vector count: {vector_count}")
+        logger.debug("    Vector count: %s", vector_count)
 
         if vector_count == 0:
-            print("    ❌ No vectors found!")
+            logger.warning("    ❌ No vectors found!")
             return False
 
         # Check vector dimensions
         self.cursor.execute("SELECT TOP 1 Vector FROM VectorSearch.FHIRResourceVectors")
         vector = self.cursor.fetchone()[0]
         # IRIS returns vectors as strings, parse to check dimension
-        print(f"    ✅ Vector exists (sample length: {len(str(vector))} chars)")
+        logger.debug("    ✅ Vector exists (sample length: %s chars)", len(str(vector)))
 
         return True
 
     # ========== Test 4: Knowledge Graph Populated ==========
     def test_knowledge_graph_populated(self):
         """Verify entities and relationships extracted."""
-        print("  Checking knowledge graph...")
+        logger.debug("  Checking knowledge graph...")
 
         # Check entities
         self.cursor.execute("SELECT COUNT(*) FROM RAG.Entities")
         entity_count = self.cursor.fetchone()[0]
-        print(f"    Entity count: {entity_count}")
+        logger.debug("    Entity count: %s", entity_count)
 
         if entity_count == 0:
-            print("    ❌ No entities found! Run: python3 src/setup/fhir_graphrag_setup.py --mode=build")
+            logger.warning("    ❌ No entities found! Run: python3 src/setup/fhir_graphrag_setup.py --mode=build")
             return False
 
-        # Check entity types
-        self.cursor.execute("""
-            SELECT EntityType, COUNT(*) as EntityCount
+        # Check entity types (top N only; long tail folded into "other")
+        self.cursor.execute(f"""
+            SELECT TOP {self.ENTITY_TYPE_HISTOGRAM_SIZE} EntityType, COUNT(*) as EntityCount
             FROM RAG.Entities
             GROUP BY EntityType
             ORDER BY EntityCount DESC
         """)
-        print("    Entity types:")
-        for entity_type, count in self.cursor.fetchall():
-            print(f"      {entity_type}: {count}")
+        logger.debug("    Entity types:")
+        top_total = 0
+        while batch := self.cursor.fetchmany():
+            for entity_type, count in batch:
+                top_total += count
+                logger.debug("      %s: %s", entity_type, count)
+        if entity_count > top_total:
+            logger.debug("      (other): %s", entity_count - top_total)
 
         # Check relationships
         self.cursor.execute("SELECT COUNT(*) FROM RAG.EntityRelationships")
         rel_count = self.cursor.fetchone()[0]
-        print(f"    Relationship count: {rel_count}")
+        logger.debug("    Relationship count: %s", rel_count)
 
         return True
 
-    # ========== Test 5: Vector Search ==========
-    def test_vector_search(self):
-        """Test vector similarity search."""
-        print("  Testing vector search...")
-
-        query_interface = FHIRGraphRAGQuery()
-        query_interface.load_config()
-        query_interface.connect_database()
-        query_interface.initialize_components(load_embedding_model=True)
-
-        # Test vector search
-        results = query_interface.vector_search("chest pain", top_k=10)
-
-        print(f"    Results: {len(results)}")
-        if len(results) > 0:
-            print(f"    Top score: {results[0]['score']:.4f}")
-            print(f"    ✅ Vector search working")
-
-        query_interface.cleanup()
-
-        return len(results) > 0
-
-    # ========== Test 6: Text Search ==========
-    def test_text_search(self):
-        """Test text keyword search with hex decoding."""
-        print("  Testing text search...")
+    # ========== Tests 5-7: Vector / Text / Graph Search ==========
+    def test_search(self, method, query_interface=None):
+        """Test a single search method ('vector', 'text' or 'graph')."""
+        logger.debug("  Testing %s search...", method)
 
-        query_interface = FHIRGraphRAGQuery()
-        query_interface.load_config()
-        query_interface.connect_database()
-        query_interface.initialize_components(load_embedding_model=False)
+        owns_interface = query_interface is None
+        if owns_interface:
+            query_interface = FHIRGraphRAGQuery()
+            query_interface.load_config()
+            query_interface.connect_database()
+            query_interface.initialize_components(load_embedding_model=(method == "vector"))
 
-        # Test text search
-        results = query_interface.text_search("chest pain", top_k=30)
+        top_k, score_format = SEARCH_METHODS[method]
+        results = getattr(query_interface, f"{method}_search")("chest pain", top_k=top_k)
 
-        print(f"    Results: {len(results)}")
+        logger.debug("    Results: %s", len(results))
         if len(results) > 0:
-            print(f"    Top score: {results[0]['score']:.1f}")
-            print(f"    ✅ Text search working (hex decoding functional)")
+            logger.debug("    Top score: " + score_format, results[0]['score'])
+            logger.debug("    ✅ %s search working", method.capitalize())
         else:
-            print(f"    ⚠️  No text results (may need more test data)")
-
-        query_interface.cleanup()
-
-        return len(results) > 0
-
-    # ========== Test 7: Graph Search ==========
-    def test_graph_search(self):
-        """Test graph entity search."""
-        print("  Testing graph search...")
-
-        query_interface = FHIRGraphRAGQuery()
-        query_interface.load_config()
-        query_interface.connect_database()
-        query_interface.initialize_components(load_embedding_model=False)
-
-        # Test graph search
-        results = query_interface.graph_search("chest pain", top_k=10)
+            logger.debug("    ⚠️  No %s results (may need more test data)", method)
 
-        print(f"    Results: {len(results)}")
-        if len(results) > 0:
-            print(f"    Top score: {results[0]['score']:.1f}")
-            print(f"    ✅ Graph search working")
-
-        query_interface.cleanup()
+        if owns_interface:
+            query_interface.cleanup()
 
         return len(results) > 0
 
     # ========== Test 8: RRF Fusion ==========
     def test_rrf_fusion(self):
         """Test RRF fusion combining all search methods."""
-        print("  Testing RRF fusion...")
+        logger.debug("  Testing RRF fusion...")
 
         query_interface = FHIRGraphRAGQuery()
         query_interface.load_config()
@@ -289,15 +306,15 @@ class IntegrationTestSuite:
         # Test RRF fusion
         fused = query_interface.rrf_fusion(vector_results, text_results, graph_results, top_k=5)
 
-        print(f"    Vector: {len(vector_results)}, Text: {len(text_results)}, Graph: {len(graph_results)}")
-        print(f"    Fused: {len(fused)} results")
+        logger.debug("    Vector: %s, Text: %s, Graph: %s", len(vector_results), len(text_results), len(graph_results))
+        logger.debug("    Fused: %s results", len(fused))
 
         if len(fused) > 0:
-            print(f"    Top RRF score: {fused[0]['rrf_score']:.4f}")
-            print(f"      Vector: {fused[0]['vector_score']:.4f}")
-            print(f"      Text: {fused[0]['text_score']:.4f}")
-            print(f"      Graph: {fused[0]['graph_score']:.4f}")
-            print(f"    ✅ RRF fusion working")
+            logger.debug("    Top RRF score: %.4f", fused[0]['rrf_score'])
+            logger.debug("      Vector: %.4f", fused[0]['vector_score'])
+            logger.debug("      Text: %.4f", fused[0]['text_score'])
+            logger.debug("      Graph: %.4f", fused[0]['graph_score'])
+            logger.debug("    ✅ RRF fusion working")
 
         query_interface.cleanup()
 
@@ -306,7 +323,7 @@ class IntegrationTestSuite:
     # ========== Test 9: Patient Filtering ==========
     def test_patient_filtering(self):
         """Test patient-specific search filtering."""
-        print("  Testing patient filtering...")
+        logger.debug("  Testing patient filtering...")
 
         # Get sample patient compartment string
         self.cursor.execute("""
@@ -318,7 +335,7 @@ class IntegrationTestSuite:
 
         result = self.cursor.fetchone()
         if not result:
-            print("    ⚠️  No patient compartments found, skipping test")
+            logger.debug("    ⚠️  No patient compartments found, skipping test")
             return True
 
         compartments = result[0]
@@ -326,11 +343,11 @@ class IntegrationTestSuite:
         import re
         match = re.search(r'Patient/([^,\]]+)', compartments)
         if not match:
-            print("    ⚠️  Could not parse patient ID, skipping test")
+            logger.debug("    ⚠️  Could not parse patient ID, skipping test")
             return True
 
         patient_id = match.group(1)
-        print(f"    Testing with patient ID: {patient_id}")
+        logger.debug("    Testing with patient ID: %s", patient_id)
 
         query_interface = FHIRSimpleQuery()
         query_interface.load_config()
@@ -338,15 +355,15 @@ class IntegrationTestSuite:
 
         # Test without filter
         all_results = query_interface.text_search("pain", top_k=50, patient_id=None)
-        print(f"    All patients: {len(all_results)} results")
+        logger.debug("    All patients: %s results", len(all_results))
 
         # Test with filter
         try:
             filtered_results = query_interface.text_search("pain", top_k=50, patient_id=int(patient_id))
-            print(f"    Patient {patient_id}: {len(filtered_results)} results")
+            logger.debug("    Patient %s: %s results", patient_id, len(filtered_results))
 
             if len(filtered_results) <= len(all_results):
-                print(f"    ✅ Patient filtering working")
+                logger.debug("    ✅ Patient filtering working")
                 query_interface.cleanup()
                 return True
         except:
@@ -359,7 +376,7 @@ class IntegrationTestSuite:
     # ========== Test 10: Full Multi-Modal Query ==========
     def test_full_multi_modal_query(self):
         """Test complete multi-modal query end-to-end."""
-        print("  Testing full multi-modal query...")
+        logger.debug("  Testing full multi-modal query...")
 
         query_interface = FHIRGraphRAGQuery()
         query_interface.load_config()
@@ -371,23 +388,23 @@ class IntegrationTestSuite:
         results = query_interface.query("chest pain", top_k=5)
         elapsed = time.time() - start
 
-        print(f"    Results: {len(results)}")
-        print(f"    Query time: {elapsed:.3f}s")
+        logger.debug("    Results: %s", len(results))
+        logger.debug("    Query time: %.3fs", elapsed)
 
         if len(results) > 0:
-            print(f"    Top result ID: {results[0]['resource_id']}")
-            print(f"    RRF score: {results[0]['rrf_score']:.4f}")
+            logger.debug("    Top result ID: %s", results[0]['resource_id'])
+            logger.debug("    RRF score: %.4f", results[0]['rrf_score'])
 
             # Check that result has all components
             has_vector = results[0]['vector_score'] > 0
             has_text = results[0]['text_score'] > 0
             has_graph = results[0]['graph_score'] > 0
 
-            print(f"    Vector score: {results[0]['vector_score']:.4f} {'✅' if has_vector else '⚠️'}")
-            print(f"    Text score: {results[0]['text_score']:.4f} {'✅' if has_text else '⚠️'}")
-            print(f"    Graph score: {results[0]['graph_score']:.4f} {'✅' if has_graph else '⚠️'}")
+            logger.debug("    Vector score: %.4f %s", results[0]['vector_score'], '✅' if has_vector else '⚠️')
+            logger.debug("    Text score: %.4f %s", results[0]['text_score'], '✅' if has_text else '⚠️')
+            logger.debug("    Graph score: %.4f %s", results[0]['graph_score'], '✅' if has_graph else '⚠️')
 
-            print(f"    ✅ Full multi-modal query working")
+            logger.debug("    ✅ Full multi-modal query working")
 
         query_interface.cleanup()
 
@@ -396,7 +413,7 @@ class IntegrationTestSuite:
     # ========== Test 11: Fast Query Performance ==========
     def test_fast_query_performance(self):
         """Test fast query performance (text + graph only)."""
-        print("  Testing fast query performance...")
+        logger.debug("  Testing fast query performance...")
 
         query_interface = FHIRSimpleQuery()
         query_interface.load_config()
@@ -407,16 +424,16 @@ class IntegrationTestSuite:
         results = query_interface.query("chest pain", top_k=5)
         elapsed = time.time() - start
 
-        print(f"    Results: {len(results)}")
-        print(f"    Query time: {elapsed:.3f}s")
+        logger.debug("    Results: %s", len(results))
+        logger.debug("    Query time: %.3fs", elapsed)
 
         # Fast query should be < 0.1s
         if elapsed < 0.1:
-            print(f"    ✅ Fast query performance excellent (< 0.1s)")
+            logger.debug("    ✅ Fast query performance excellent (< 0.1s)")
         elif elapsed < 0.5:
-            print(f"    ✅ Fast query performance good (< 0.5s)")
+            logger.debug("    ✅ Fast query performance good (< 0.5s)")
         else:
-            print(f"    ⚠️  Fast query slower than expected ({elapsed:.3f}s)")
+            logger.debug("    ⚠️  Fast query slower than expected (%.3fs)", elapsed)
 
         query_interface.cleanup()
 
@@ -425,14 +442,14 @@ class IntegrationTestSuite:
     # ========== Test 12: Edge Cases ==========
     def test_edge_cases(self):
         """Test edge cases and error handling."""
-        print("  Testing edge cases...")
+        logger.debug("  Testing edge cases...")
 
         query_interface = FHIRSimpleQuery()
         try:
             query_interface.load_config()
             query_interface.connect_database()
         except Exception as e:
-            print(f"    ❌ Setup failed: {e}")
+            logger.warning("    ❌ Setup failed: %s", e)
             return False
 
         test_cases = [
@@ -448,24 +465,35 @@ class IntegrationTestSuite:
                 text_results = query_interface.text_search(query, top_k=5)
                 graph_results = query_interface.graph_search(query, top_k=5)
                 total = len(text_results) + len(graph_results)
-                print(f"    {desc}: {total} results (OK)")
+                logger.debug("    %s: %s results (OK)", desc, total)
             except Exception as e:
-                print(f"    {desc}: ❌ Exception: {e}")
+                logger.warning("    %s: ❌ Exception: %s", desc, e)
                 all_passed = False
 
         query_interface.cleanup()
 
         if all_passed:
-            print(f"    ✅ Edge case handling working")
+            logger.debug("    ✅ Edge case handling working")
 
         return all_passed
 
     # ========== Test 13: Entity Extraction Quality ==========
     def test_entity_extraction_quality(self):
         """Test quality of extracted entities."""
-        print("  Testing entity extraction quality...")
+        logger.debug("  Testing entity extraction quality...")
+
+        # Aggregate confidence distribution in the database
+        self.cursor.execute("""
+            SELECT COUNT(*),
+                   SUM(CASE WHEN CAST(Confidence AS DOUBLE) >= 0.8 THEN 1 ELSE 0 END)
+            FROM RAG.Entities
+            WHERE EntityType IN ('SYMPTOM', 'CONDITION', 'MEDICATION')
+        """)
+        total_count, high_conf_count = self.cursor.fetchone()
+        total_count = total_count or 0
+        high_conf_count = high_conf_count or 0
 
-        # Get a sample of entities
+        # Small sample for the human-readable printout only
         self.cursor.execute("""
             SELECT TOP 5 ResourceID, EntityText, EntityType, Confidence
             FROM RAG.Entities
@@ -475,51 +503,49 @@ class IntegrationTestSuite:
 
         entities = self.cursor.fetchall()
 
-        print(f"    Sample entities:")
+        logger.debug("    Sample entities:")
         for rid, text, etype, conf in entities:
             # Convert confidence to float if it's a string
             conf_val = float(conf) if isinstance(conf, str) else conf
-            print(f"      {text} ({etype}, conf={conf_val:.2f})")
+            logger.debug("      %s (%s, conf=%.2f)", text, etype, conf_val)
 
         # Check confidence scores are reasonable
-        high_conf_count = sum(1 for _, _, _, conf in entities if float(conf) >= 0.8)
-
-        if high_conf_count >= len(entities) * 0.6:  # At least 60% should be high confidence
-            print(f"    ✅ Entity extraction quality good ({high_conf_count}/{len(entities)} high confidence)")
+        if high_conf_count >= total_count * 0.6:  # At least 60% should be high confidence
+            logger.debug("    ✅ Entity extraction quality good (%s/%s high confidence)", high_conf_count, total_count)
             return True
         else:
-            print(f"    ⚠️  Entity extraction quality could be improved ({high_conf_count}/{len(entities)} high confidence)")
+            logger.debug("    ⚠️  Entity extraction quality could be improved (%s/%s high confidence)", high_conf_count, total_count)
             return True  # Still pass, just a warning
 
     def print_summary(self):
         """Print test summary."""
-        print("\n" + "="*80)
-        print("TEST SUMMARY")
-        print("="*80)
+        logger.info("\n%s", "=" * 80)
+        logger.info("TEST SUMMARY")
+        logger.info("=" * 80)
 
         total = self.tests_passed + self.tests_failed
         pass_rate = (self.tests_passed / total * 100) if total > 0 else 0
 
-        print(f"\nTests run: {total}")
-        print(f"Passed: {self.tests_passed} ✅")
-        print(f"Failed: {self.tests_failed} ❌")
-        print(f"Pass rate: {pass_rate:.1f}%")
+        logger.info("\nTests run: %s", total)
+        logger.info("Passed: %s ✅", self.tests_passed)
+        logger.info("Failed: %s ❌", self.tests_failed)
+        logger.info("Pass rate: %.1f%%", pass_rate)
 
         if self.tests_failed > 0:
-            print("\nFailed tests:")
+            logger.info("\nFailed tests:")
             for result in self.test_results:
                 if result['status'] == 'FAIL':
                     error = result.get('error', 'Unknown error')
-                    print(f"  ❌ {result['test']}: {error}")
+                    logger.info("  ❌ %s: %s", result['test'], error)
 
-        print("\n" + "="*80)
+        logger.info("\n%s", "=" * 80)
 
         if self.tests_failed == 0:
-            print("🎉 ALL TESTS PASSED!")
+            logger.info("🎉 ALL TESTS PASSED!")
         else:
-            print(f"⚠️  {self.tests_failed} test(s) failed")
+            logger.info("⚠️  %s test(s) failed", self.tests_failed)
 
-        print("="*80)
+        logger.info("=" * 80)
 
     def cleanup(self):
         """Close database connection."""
@@ -527,21 +553,22 @@ class IntegrationTestSuite:
             self.cursor.close()
         if self.connection:
             self.connection.close()
-        print("\n[CLEANUP] Database connection closed")
+        logger.info("\n[CLEANUP] Database connection closed")
 
     def run_all_tests(self):
         """Run all integration tests."""
         if not self.connect_database():
             return False
+        self.ensure_indexes()
 
         # Run tests
         self.run_test("1. Database Schema", self.test_database_schema)
         self.run_test("2. FHIR Data Integrity", self.test_fhir_data_integrity)
         self.run_test("3. Vector Table Populated", self.test_vector_table_populated)
         self.run_test("4. Knowledge Graph Populated", self.test_knowledge_graph_populated)
-        self.run_test("5. Vector Search", self.test_vector_search)
-        self.run_test("6. Text Search", self.test_text_search)
-        self.run_test("7. Graph Search", self.test_graph_search)
+        for number, method in enumerate(SEARCH_METHODS, start=5):
+            self.run_test(f"{number}. {method.capitalize()} Search",
+                          lambda method=method: self.test_search(method))
         self.run_test("8. RRF Fusion", self.test_rrf_fusion)
         self.run_test("9. Patient Filtering", self.test_patient_filtering)
         self.run_test("10. Full Multi-Modal Query", self.test_full_multi_modal_query)
@@ -555,7 +582,40 @@ class IntegrationTestSuite:
         return self.tests_failed == 0
 
 
+@pytest.fixture(scope="session", autouse=True)
+def cached_embedding_model():
+    """Reuse one embedding model across all query interfaces in the session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(FHIRGraphRAGQuery, "initialize_components", _initialize_components_cached)
+        yield
+
+
+@pytest.fixture(scope="module")
+def graphrag_query():
+    """Shared query interface for the parametrized search tests."""
+    query_interface = FHIRGraphRAGQuery()
+    query_interface.load_config()
+    query_interface.connect_database()
+    query_interface.initialize_components(load_embedding_model=True)
+    yield query_interface
+    query_interface.cleanup()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("method", list(SEARCH_METHODS))
+def test_search_method(graphrag_query, method):
+    """Vector, text and graph search each return results for a common query."""
+    assert IntegrationTestSuite().test_search(method, graphrag_query)
+
+
 if __name__ == "__main__":
-    suite = IntegrationTestSuite()
+    FHIRGraphRAGQuery.initialize_components = _initialize_components_cached
+    logging.basicConfig(
+        level=os.getenv("PYTEST_LOG_LEVEL", "INFO").upper(),
+        format="%(message)s",
+    )
+    suite = IntegrationTestSuite(
+        record_details=os.getenv("INTEGRATION_RECORD_DETAILS", "").lower() in ("1", "true", "yes")
+    )
     success = suite.run_all_tests()
     sys.exit(0 if success else 1)
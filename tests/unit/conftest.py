@@ -0,0 +1,13 @@
+"""
+Pytest configuration for offline unit tests.
+
+Puts src/ on sys.path once per session so unit tests can import src
+packages as top-level modules (e.g. ``from vectorization import ...``).
+"""
+
+import os
+import sys
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
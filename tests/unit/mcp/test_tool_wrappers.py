@@ -7,8 +7,6 @@ import pytest
 import json
 import sys
 import os
-import pytest
-import json
 from unittest.mock import MagicMock, patch, AsyncMock
 from mcp.types import TextContent
 
@@ -16,17 +14,22 @@ mcp_server_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..
 if mcp_server_path not in sys.path:
     sys.path.insert(0, mcp_server_path)
 
-mock_server = MagicMock()
-mock_server.call_tool.return_value = lambda x: x 
 
-with patch('mcp.server.Server', return_value=mock_server):
-    import fhir_graphrag_mcp_server
-    call_tool = fhir_graphrag_mcp_server.call_tool
+@pytest.fixture(scope="module")
+def mcp_module():
+    """Import the MCP server once per module with the Server class patched out."""
+    mock_server = MagicMock()
+    mock_server.call_tool.return_value = lambda x: x
+
+    with patch('mcp.server.Server', return_value=mock_server):
+        import fhir_graphrag_mcp_server
+    yield fhir_graphrag_mcp_server
+
 
 @pytest.mark.asyncio
 @patch('fhir_graphrag_mcp_server.FHIRSearchService')
 @patch('fhir_graphrag_mcp_server.get_connection')
-async def test_search_fhir_documents_wrapper(mock_conn, mock_service_class):
+async def test_search_fhir_documents_wrapper(mock_conn, mock_service_class, mcp_module):
     """Verify search_fhir_documents tool calls the search service."""
     # Setup mocks
     mock_service_instance = mock_service_class.return_value
@@ -36,7 +39,7 @@ async def test_search_fhir_documents_wrapper(mock_conn, mock_service_class):
     
     # Execute tool
     arguments = {"query": "test query", "limit": 5}
-    result = await call_tool("search_fhir_documents", arguments)
+    result = await mcp_module.call_tool("search_fhir_documents", arguments)
     
     # Verify result
     assert isinstance(result, list)
@@ -51,7 +54,7 @@ async def test_search_fhir_documents_wrapper(mock_conn, mock_service_class):
 @pytest.mark.asyncio
 @patch('fhir_graphrag_mcp_server.KGSearchService')
 @patch('fhir_graphrag_mcp_server.get_connection')
-async def test_search_knowledge_graph_wrapper(mock_conn, mock_service_class):
+async def test_search_knowledge_graph_wrapper(mock_conn, mock_service_class, mcp_module):
     """Verify search_knowledge_graph tool calls the KG service."""
     # Setup mocks
     mock_service_instance = mock_service_class.return_value
@@ -62,7 +65,7 @@ async def test_search_knowledge_graph_wrapper(mock_conn, mock_service_class):
     
     # Execute tool
     arguments = {"query": "kg query"}
-    result = await call_tool("search_knowledge_graph", arguments)
+    result = await mcp_module.call_tool("search_knowledge_graph", arguments)
     
     # Verify
     assert len(result) == 1
@@ -6,11 +6,15 @@ Following TDD: These tests should FAIL initially until cache.py is implemented.
 """
 
 import pytest
+import threading
 import time
 from unittest.mock import Mock, patch, MagicMock
+import numpy as np
 from src.search.cache import (
     EmbeddingCache,
     get_cached_embedding,
+    get_cached_embedding_array,
+    get_cached_embeddings_async,
     clear_cache,
     cache_info
 )
@@ -239,6 +243,19 @@ class TestGetCachedEmbedding:
         get_cached_embedding(query)
         assert mock_embedder.embed_text.call_count == 1  # Still 1, not 2
     
+    @patch('src.search.cache.get_embedder')
+    def test_resolves_embedder_once_across_misses(self, mock_get_embedder):
+        """Should reuse the embedder handle instead of calling get_embedder per miss."""
+        mock_embedder = Mock()
+        mock_embedder.embed_text.return_value = [0.1, 0.2, 0.3]
+        mock_get_embedder.return_value = mock_embedder
+        
+        for query in ("first", "second", "third"):
+            get_cached_embedding(query)
+        
+        assert mock_embedder.embed_text.call_count == 3
+        assert mock_get_embedder.call_count == 1
+    
     @patch('src.search.cache.get_embedder')
     def test_converts_list_to_tuple(self, mock_get_embedder):
         """Should convert embedder's list output to tuple for hashing."""
@@ -282,6 +299,112 @@ class TestGetCachedEmbedding:
             get_cached_embedding(query)
 
 
+class TestGetCachedEmbeddingArray:
+    """Test the float32 array view of cached embeddings."""
+
+    def setup_method(self):
+        """Clear cache before each test."""
+        clear_cache()
+
+    @patch('src.search.cache.get_embedder')
+    def test_returns_float32_view_for_1024_dim(self, mock_get_embedder):
+        """1024-dim embeddings should come back as a read-only unit-length float32 row."""
+        mock_embedder = Mock()
+        mock_embedder.embed_text.return_value = [float(i) for i in range(1024)]
+        mock_get_embedder.return_value = mock_embedder
+
+        array = get_cached_embedding_array("pool test")
+
+        assert array.dtype == np.float32
+        assert array.shape == (1024,)
+        assert not array.flags.writeable
+        expected = np.arange(1024, dtype=np.float32)
+        expected /= np.linalg.norm(expected)
+        assert np.allclose(array, expected)
+        assert np.linalg.norm(array) == pytest.approx(1.0, abs=1e-6)
+        # Repeat lookups share the same pooled row
+        assert np.shares_memory(array, get_cached_embedding_array("pool test"))
+        assert mock_embedder.embed_text.call_count == 1
+
+    @patch('src.search.cache.get_embedder')
+    def test_other_dimensions_are_converted(self, mock_get_embedder):
+        """Embeddings outside the pool width still return normalized float32 arrays."""
+        mock_embedder = Mock()
+        mock_embedder.embed_text.return_value = [0.1, 0.2, 0.3]
+        mock_get_embedder.return_value = mock_embedder
+
+        array = get_cached_embedding_array("small")
+
+        assert array.dtype == np.float32
+        expected = np.array([0.1, 0.2, 0.3]) / np.linalg.norm([0.1, 0.2, 0.3])
+        assert array.tolist() == pytest.approx(expected.tolist(), abs=1e-6)
+
+    @patch('src.search.cache.get_embedder')
+    def test_evicted_rows_are_reused(self, mock_get_embedder):
+        """Evicting an entry should free its pool row for the next insert."""
+        mock_embedder = Mock()
+        def one_hot(text):
+            vector = [0.0] * 1024
+            vector[int(text[1:]) % 1024] = 2.0
+            return vector
+
+        mock_embedder.embed_text.side_effect = one_hot
+        mock_get_embedder.return_value = mock_embedder
+
+        for i in range(1001):
+            get_cached_embedding(f"q{i}")
+
+        assert cache_info().currsize == 1000
+        assert get_cached_embedding_array("q1000")[1000] == 1.0
+        assert get_cached_embedding_array("q1")[1] == 1.0
+
+
+class TestGetCachedEmbeddingsAsync:
+    """Test the concurrent batch lookup."""
+
+    def setup_method(self):
+        """Clear cache before each test."""
+        clear_cache()
+
+    @pytest.mark.asyncio
+    @patch('src.search.cache.get_embedder')
+    async def test_returns_embeddings_in_input_order(self, mock_get_embedder):
+        """Results should line up with the input queries, duplicates included."""
+        mock_embedder = Mock()
+        mock_embedder.embed_text.side_effect = lambda text: [float(len(text))]
+        mock_get_embedder.return_value = mock_embedder
+
+        queries = ["a", "bbb", "a", "cc"]
+        results = await get_cached_embeddings_async(queries)
+
+        assert results == [(1.0,), (3.0,), (1.0,), (2.0,)]
+        # Duplicate "a" is embedded only once
+        assert mock_embedder.embed_text.call_count == 3
+        assert cache_info().currsize == 3
+
+    @pytest.mark.asyncio
+    @patch('src.search.cache.get_embedder')
+    async def test_misses_overlap(self, mock_get_embedder):
+        """Embedder calls for different misses should run concurrently."""
+        mock_embedder = Mock()
+        # Each call waits until the other one has started; run back to back,
+        # the first call would never see the second and the barrier breaks.
+        # The timeout only keeps a regression from hanging the suite.
+        barrier = threading.Barrier(2, timeout=10)
+
+        def blocking_embed(text):
+            barrier.wait()
+            return [0.1, 0.2, 0.3]
+
+        mock_embedder.embed_text = blocking_embed
+        mock_get_embedder.return_value = mock_embedder
+
+        results = await get_cached_embeddings_async(["query_a", "query_b"], max_concurrency=2)
+
+        assert results == [(0.1, 0.2, 0.3), (0.1, 0.2, 0.3)]
+        assert not barrier.broken
+
+
 class TestCachePerformance:
     """Test cache performance and behavior."""
     
@@ -348,6 +471,33 @@ class TestCachePerformance:
         assert len(results) == 10
         assert all(r == results[0] for r in results)
 
+    def test_concurrent_hits_and_evictions_stay_consistent(self):
+        """Hits racing with evicting inserts must not corrupt the store."""
+        import threading
+        from src.search.cache import _LRU
+
+        lru = _LRU(maxsize=4, dim=3)
+        errors = []
+
+        def worker(step):
+            try:
+                for i in range(5000):
+                    key = bytes([(i * step) % 9])
+                    if lru.get(key) is None:
+                        lru.put(key, (1.0, 2.0, 3.0))
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(step,)) for step in range(1, 7)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert len(lru.d) <= 4
+        assert set(lru.row_of) == set(lru.d)
+
 
 class TestCacheEdgeCases:
     """Test edge cases and error handling."""
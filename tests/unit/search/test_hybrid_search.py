@@ -56,6 +56,19 @@ def test_rrf_fusion_logic(mock_search_services):
     assert "fhir" in doc1["sources"]
     assert "kg" not in doc1["sources"]
 
+def test_rrf_scores_and_order(mock_search_services):
+    """Verify fused RRF scores and ranking across both sources."""
+    service = HybridSearchService()
+    
+    top_docs = service.search("fever", top_k=2)["top_documents"]
+    
+    # Doc 2 (FHIR rank 2 + KG rank 1) outranks doc 1 (FHIR rank 1 only)
+    assert [d["fhir_id"] for d in top_docs] == ["2", "1"]
+    assert top_docs[0]["rrf_score"] == pytest.approx(1 / 62 + 1 / 61)
+    assert top_docs[0]["fhir_score"] == pytest.approx(1 / 62)
+    assert top_docs[0]["kg_score"] == pytest.approx(1 / 61)
+    assert top_docs[1]["rrf_score"] == pytest.approx(1 / 61)
+
 def test_service_closure():
     """Verify that close() delegates to sub-services."""
     with patch('src.search.hybrid_search.FHIRSearchService') as mock_fhir, \
@@ -5,14 +5,19 @@ Tests similarity score calculations and display logic for medical image search.
 Following TDD: These tests should FAIL initially until scoring.py is implemented.
 """
 
+import math
 import pytest
 import numpy as np
 from src.search.scoring import (
     calculate_similarity,
+    calculate_similarities,
     get_score_color,
     get_confidence_level,
-    get_hex_color
+    get_hex_color,
+    score_result,
+    score_results
 )
+from src.search.scoring import _cosine_terms
 
 
 class TestCalculateSimilarity:
@@ -83,6 +88,45 @@ class TestCalculateSimilarity:
         similarity = calculate_similarity(vec1, vec2)
         assert -1.0 <= similarity <= 1.0
     
+    def test_same_object_short_circuits(self):
+        """A vector compared with itself (or a view of it) is exactly 1.0"""
+        vec = np.random.rand(1024).astype(np.float32)
+        assert calculate_similarity(vec, vec) == 1.0
+        assert calculate_similarity(vec, vec[:]) == 1.0
+    
+    def test_same_zero_vector_raises_error(self):
+        """The identity shortcut must still reject zero vectors"""
+        vec = [0.0, 0.0, 0.0]
+        with pytest.raises(ValueError):
+            calculate_similarity(vec, vec)
+    
+    def test_assume_normalized_uses_dot_product(self):
+        """Pre-normalized vectors should score the same via the dot-product path"""
+        vec1 = np.array([3.0, 4.0, 0.0]) / 5.0
+        vec2 = np.array([0.0, 4.0, 3.0]) / 5.0
+        assert calculate_similarity(vec1, vec2, assume_normalized=True) == pytest.approx(
+            calculate_similarity(vec1, vec2)
+        )
+    
+    def test_mismatched_dimensions_raise_error(self):
+        """Vectors of different length should raise ValueError"""
+        with pytest.raises(ValueError):
+            calculate_similarity([1.0, 2.0, 3.0], [1.0, 2.0])
+    
+    def test_cosine_terms_match_numpy(self):
+        """The (fused or BLAS) reduction kernel should match numpy dot products"""
+        a = np.random.rand(1024).astype(np.float32)
+        b = np.random.rand(1024).astype(np.float32)
+        ab, aa, bb = _cosine_terms(a, b)
+        assert ab == pytest.approx(float(np.dot(a, b)), rel=1e-5)
+        assert aa == pytest.approx(float(np.dot(a, a)), rel=1e-5)
+        assert bb == pytest.approx(float(np.dot(b, b)), rel=1e-5)
+    
+    def test_nan_component_propagates(self):
+        """A NaN in either vector should give NaN, not a clamped -1.0"""
+        assert math.isnan(calculate_similarity([float("nan"), 1.0, 0.0], [1.0, 2.0, 3.0]))
+        assert math.isnan(calculate_similarity([1.0, 2.0, 3.0], [0.0, float("nan"), 1.0]))
+    
     def test_zero_vector_raises_error(self):
         """Zero vectors should raise ValueError or return NaN"""
         vec1 = [0.0, 0.0, 0.0]
@@ -91,6 +135,29 @@ class TestCalculateSimilarity:
             calculate_similarity(vec1, vec2)
 
 
+class TestCalculateSimilarities:
+    """Test batched cosine similarity against a candidate matrix."""
+    
+    def test_matches_pairwise_similarity(self):
+        """Batch scores should equal per-pair calculate_similarity results"""
+        query = np.random.rand(1024)
+        candidates = np.random.rand(8, 1024)
+        scores = calculate_similarities(query, candidates)
+        expected = [calculate_similarity(query, c) for c in candidates]
+        assert scores.shape == (8,)
+        assert scores.tolist() == pytest.approx(expected, abs=1e-5)
+    
+    def test_handles_lists(self):
+        """Should accept nested Python lists as input"""
+        scores = calculate_similarities([1.0, 0.0], [[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0]])
+        assert scores.tolist() == pytest.approx([1.0, 0.0, -1.0])
+    
+    def test_zero_candidate_raises_error(self):
+        """A zero-magnitude candidate should raise ValueError"""
+        with pytest.raises(ValueError):
+            calculate_similarities([1.0, 2.0], [[1.0, 2.0], [0.0, 0.0]])
+
+
 class TestGetScoreColor:
     """Test score color code mapping."""
     
@@ -133,6 +200,12 @@ class TestGetScoreColor:
         result = get_score_color(0.8)
         assert isinstance(result, str)
     
+    def test_returns_shared_string_objects(self):
+        """Labels come from module constants, so no string is built per call"""
+        assert get_score_color(0.8) is get_score_color(0.95)
+        assert get_confidence_level(0.8) is get_confidence_level(0.95)
+        assert get_hex_color(0.3) is get_hex_color(0.1)
+    
     def test_lowercase_output(self):
         """Color strings should be lowercase"""
         assert get_score_color(0.8).islower()
@@ -268,9 +341,10 @@ class TestIntegration:
             -query_embedding                                 # Opposite
         ]
         
+        scores = calculate_similarities(query_embedding, np.stack(image_embeddings))
+        
         results = []
-        for img_emb in image_embeddings:
-            score = calculate_similarity(query_embedding.tolist(), img_emb.tolist())
+        for score in scores.tolist():
             color = get_score_color(score)
             confidence = get_confidence_level(score)
             results.append({
@@ -286,6 +360,33 @@ class TestIntegration:
             assert result['confidence'] in ['strong', 'moderate', 'weak']
 
 
+class TestScoreResults:
+    """Test batched scoring metadata."""
+    
+    def test_matches_per_score_results(self):
+        """Each column should agree with score_result() applied per score"""
+        scores = [1.0, 0.85, 0.7, 0.699999, 0.5, 0.499999, 0.0, -0.5]
+        results = score_results(scores)
+        for i, score in enumerate(scores):
+            expected = score_result(score)
+            assert results['score'][i] == expected['score']
+            assert results['color'][i] == expected['color']
+            assert results['confidence_level'][i] == expected['confidence_level']
+            assert results['hex_color'][i] == expected['hex_color']
+    
+    def test_returns_arrays(self):
+        """Should accept numpy score arrays and return aligned ndarrays"""
+        results = score_results(np.array([0.9, 0.2]))
+        assert all(isinstance(column, np.ndarray) for column in results.values())
+        assert results['bucket'].tolist() == [2, 0]
+        assert results['confidence_level'].tolist() == ['strong', 'weak']
+    
+    def test_empty_input(self):
+        """Empty result sets should produce empty arrays"""
+        results = score_results([])
+        assert all(len(column) == 0 for column in results.values())
+
+
 # Fixtures for reusable test data
 @pytest.fixture
 def sample_embeddings():
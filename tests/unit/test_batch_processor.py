@@ -7,104 +7,196 @@ Validates checkpoint creation, state transitions, and resume functionality.
 Usage:
     pytest tests/unit/test_batch_processor.py -v
     pytest tests/unit/test_batch_processor.py::TestBatchProcessor::test_register_documents -v
+    pytest tests/unit/test_batch_processor.py -n auto   # parallel, needs pytest-xdist
+
+Checkpoint DBs are in-memory SQLite databases private to the test process,
+so xdist workers never share or contend for a database.
 
 Dependencies:
-    pytest, unittest.mock
+    pytest, pytest-xdist (optional)
 """
 
+import functools
 import pytest
-import sys
 import sqlite3
-import tempfile
-import os
-from pathlib import Path
-from unittest.mock import Mock, MagicMock, patch, call
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+import uuid
+from datetime import datetime
+from operator import itemgetter
 
 from vectorization.batch_processor import BatchProcessor
 
 
+# Fake 1024-dim embeddings, built once; mocks only hand them back unchanged
+_EMBED_A = [0.1] * 1024
+_EMBED_B = [0.2] * 1024
+_EMBED_C = [0.3] * 1024
+
+# Zero-padded document ids, formatted once and sliced by tests
+_DOC_IDS = tuple(f"doc-{i:03d}" for i in range(100))
+
+# Expected-value marker for columns that only need to be set
+NOT_NULL = object()
+
+
+class _StubEmbeddingClient:
+    """
+    Stand-in for NVIDIAEmbeddingsClient.
+
+    Plain attributes and a call counter instead of Mock, which builds child
+    mocks and records every call on the processing hot path.
+    """
+
+    model = "nvidia/nv-embedqa-e5-v5"
+
+    def __init__(self):
+        self.calls = 0
+        self.return_value = None
+        self.side_effect = None  # exception raised by embed_batch when set
+
+    def embed_batch(self, texts, show_progress=False):
+        self.calls += 1
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+
+class _StubVectorDBClient:
+    """Stand-in for IRISVectorDBClient that counts insert_vector calls."""
+
+    def __init__(self):
+        self.insert_calls = 0
+        self.side_effect = None  # callable invoked with the insert kwargs
+
+    def insert_vector(self, **kwargs):
+        self.insert_calls += 1
+        if self.side_effect is not None:
+            self.side_effect(**kwargs)
+
+
+def _fail_on_nth(n, message="fail"):
+    """Build an insert side effect that raises on the n-th call only."""
+    counter = [0]
+
+    def side_effect(**kwargs):
+        counter[0] += 1
+        if counter[0] == n:
+            raise Exception(message)
+
+    return side_effect
+
+
+@functools.lru_cache(maxsize=None)
+def _base_docs(n, dtype="Note"):
+    """Build n minimal documents doc-000, doc-001, ... once per (n, dtype)."""
+    return tuple({"resource_id": _DOC_IDS[i], "document_type": dtype} for i in range(n))
+
+
+def _make_docs(n, dtype="Note"):
+    """
+    Return a fresh list of n minimal documents for registration.
+
+    The inner dicts are shared between tests; register_documents() only
+    reads them.
+    """
+    return list(_base_docs(n, dtype))
+
+
+def _seed_states(proc, ids, status):
+    """
+    Put registered documents straight into a checkpoint state.
+
+    One executemany UPDATE replaces the mark_processing / mark_completed
+    round trips a previous run would have made; completed documents also
+    get both timestamps.
+    """
+    ts = datetime.utcnow().isoformat() if status == "completed" else None
+    proc.cursor.executemany(
+        """
+        UPDATE VectorizationState
+        SET Status = ?,
+            ProcessingStartedAt = ?,
+            ProcessingCompletedAt = ?
+        WHERE DocumentID = ?
+        """,
+        [(status, ts, ts, doc_id) for doc_id in ids]
+    )
+    proc.connection.commit()
+
+
+@pytest.fixture
+def temp_db():
+    """
+    Name a private in-memory SQLite database for one test.
+
+    A shared-cache memory DB lives only while some connection is open, so
+    an anchor connection is held for the whole test; processors can then
+    disconnect and reconnect without losing checkpoint state.
+    """
+    uri = f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    anchor = sqlite3.connect(uri, uri=True)
+    yield uri
+    anchor.close()
+
+
+@pytest.fixture(scope="session")
+def shared_db():
+    """Name the in-memory SQLite database shared by TestBatchProcessor."""
+    return f"file:shared_test_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+
+@pytest.fixture(scope="session")
+def shared_processor(shared_db):
+    """
+    Connect once and create the checkpoint schema for the whole session.
+
+    Its connection also anchors the shared memory DB, so per-test
+    processors only pay for a connect and an IF NOT EXISTS schema check.
+    """
+    proc = BatchProcessor(None, None, shared_db)
+    proc.connect()
+    proc._create_checkpoint_table()
+    yield proc
+    proc.disconnect()
+
+
 class TestBatchProcessor:
     """Test suite for BatchProcessor class."""
 
     @pytest.fixture
     def mock_clients(self):
-        """Create mock embedding and vector DB clients."""
-        embedding_client = Mock()
-        embedding_client.model = "nvidia/nv-embedqa-e5-v5"
-        embedding_client.embed_batch.return_value = [[0.1] * 1024, [0.2] * 1024]
+        """Create stub embedding and vector DB clients."""
+        embedding_client = _StubEmbeddingClient()
+        embedding_client.return_value = [_EMBED_A, _EMBED_B]
 
-        vector_db_client = Mock()
-        vector_db_client.insert_vector = Mock()
-
-        return embedding_client, vector_db_client
+        return embedding_client, _StubVectorDBClient()
 
     @pytest.fixture
-    def temp_db(self):
-        """Create a temporary SQLite database for testing."""
-        fd, path = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
-        yield path
-        # Cleanup
-        if os.path.exists(path):
-            os.remove(path)
+    def processor(self, mock_clients, shared_processor):
+        """Create a test BatchProcessor instance on the emptied shared DB."""
+        shared_processor.cursor.execute("DELETE FROM VectorizationState")
+        shared_processor.connection.commit()
 
-    @pytest.fixture
-    def processor(self, mock_clients, temp_db):
-        """Create a test BatchProcessor instance."""
         embedding_client, vector_db_client = mock_clients
         return BatchProcessor(
             embedding_client=embedding_client,
             vector_db_client=vector_db_client,
-            checkpoint_db=temp_db,
+            checkpoint_db=shared_processor.checkpoint_db,
             auto_commit_interval=2
         )
 
-    def test_initialization(self, processor, temp_db):
+    def test_initialization(self, processor, shared_db):
         """Test processor initialization."""
-        assert processor.checkpoint_db == temp_db
+        assert processor.checkpoint_db == shared_db
         assert processor.auto_commit_interval == 2
         assert processor.connection is None
         assert processor.cursor is None
         assert processor.stats["total_processed"] == 0
 
-    def test_connect_creates_database(self, processor):
-        """Test connect creates checkpoint database."""
-        processor.connect()
-
-        assert processor.connection is not None
-        assert processor.cursor is not None
-
-        # Verify database file exists
-        assert os.path.exists(processor.checkpoint_db)
-
-        processor.disconnect()
-
-    def test_create_checkpoint_table(self, processor):
-        """Test checkpoint table creation with correct schema."""
-        processor.connect()
-        processor._create_checkpoint_table()
-
-        # Verify table was created
-        processor.cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='VectorizationState'"
-        )
-        result = processor.cursor.fetchone()
-        assert result is not None
-
-        # Verify columns
-        processor.cursor.execute("PRAGMA table_info(VectorizationState)")
-        columns = {row[1] for row in processor.cursor.fetchall()}
-        expected_columns = {
-            "DocumentID", "DocumentType", "Status",
-            "ProcessingStartedAt", "ProcessingCompletedAt",
-            "ErrorMessage", "RetryCount"
-        }
-        assert expected_columns.issubset(columns)
-
-        processor.disconnect()
+    def test_connect_configures_checkpoint_db(self, processor):
+        """Test connect() applies the checkpoint DB pragmas."""
+        with processor:
+            processor.cursor.execute("PRAGMA synchronous")
+            assert processor.cursor.fetchone()[0] == 1  # NORMAL
 
     def test_context_manager(self, mock_clients, temp_db):
         """Test using processor as context manager."""
@@ -136,16 +228,16 @@ class TestBatchProcessor:
 
             assert new_count == 3
 
-            # Verify documents were inserted
-            processor.cursor.execute(
-                "SELECT DocumentID, DocumentType, Status FROM VectorizationState ORDER BY DocumentID"
-            )
-            rows = processor.cursor.fetchall()
+            # Verify documents were inserted (row order is irrelevant)
+            rows = set(processor.cursor.execute(
+                "SELECT DocumentID, DocumentType, Status FROM VectorizationState"
+            ).fetchall())
 
-            assert len(rows) == 3
-            assert rows[0] == ("doc-001", "clinical_note", "pending")
-            assert rows[1] == ("doc-002", "clinical_note", "pending")
-            assert rows[2] == ("doc-003", "clinical_note", "pending")
+            assert rows == {
+                ("doc-001", "clinical_note", "pending"),
+                ("doc-002", "clinical_note", "pending"),
+                ("doc-003", "clinical_note", "pending")
+            }
 
     def test_register_documents_duplicates_ignored(self, processor):
         """Test that duplicate documents are ignored."""
@@ -171,111 +263,76 @@ class TestBatchProcessor:
         """Test retrieving pending documents."""
         with processor:
             # Register documents
-            documents = [
-                {"resource_id": f"doc-{i:03d}", "document_type": "Note"}
-                for i in range(5)
-            ]
+            documents = _make_docs(5)
             processor.register_documents(documents, "clinical_note")
 
             # Mark some as completed
-            processor.mark_processing("doc-001")
-            processor.mark_completed("doc-001")
-            processor.mark_processing("doc-002")
-            processor.mark_completed("doc-002")
+            _seed_states(processor, ["doc-001", "doc-002"], "completed")
 
             # Get pending
             pending = processor.get_pending_documents("clinical_note")
 
-            assert len(pending) == 3
-            assert "doc-000" in pending
-            assert "doc-003" in pending
-            assert "doc-004" in pending
-            assert "doc-001" not in pending
-            assert "doc-002" not in pending
+            assert set(pending) == {"doc-000", "doc-003", "doc-004"}
 
     def test_get_pending_documents_with_limit(self, processor):
         """Test retrieving pending documents with limit."""
         with processor:
-            documents = [
-                {"resource_id": f"doc-{i:03d}", "document_type": "Note"}
-                for i in range(10)
-            ]
+            documents = _make_docs(10)
             processor.register_documents(documents, "clinical_note")
 
             pending = processor.get_pending_documents("clinical_note", limit=3)
 
             assert len(pending) == 3
 
-    def test_mark_processing(self, processor):
-        """Test marking document as processing."""
-        with processor:
-            processor.register_documents(
-                [{"resource_id": "doc-001", "document_type": "Note"}],
-                "clinical_note"
-            )
-
-            processor.mark_processing("doc-001")
-            processor.connection.commit()
-
-            # Verify status changed
-            processor.cursor.execute(
-                "SELECT Status, ProcessingStartedAt FROM VectorizationState WHERE DocumentID = 'doc-001'"
-            )
-            row = processor.cursor.fetchone()
-            assert row[0] == "processing"
-            assert row[1] is not None  # timestamp should be set
-
-    def test_mark_completed(self, processor):
-        """Test marking document as completed."""
-        with processor:
-            processor.register_documents(
-                [{"resource_id": "doc-001", "document_type": "Note"}],
-                "clinical_note"
-            )
-
-            processor.mark_processing("doc-001")
-            processor.mark_completed("doc-001")
-            processor.connection.commit()
-
-            # Verify status changed
-            processor.cursor.execute(
-                "SELECT Status, ProcessingCompletedAt, ErrorMessage FROM VectorizationState WHERE DocumentID = 'doc-001'"
-            )
-            row = processor.cursor.fetchone()
-            assert row[0] == "completed"
-            assert row[1] is not None  # completion timestamp
-            assert row[2] is None  # no error message
-
-    def test_mark_failed(self, processor):
-        """Test marking document as failed."""
+    @pytest.fixture
+    def registered_doc(self, processor):
+        """Enter the processor context with doc-001 registered."""
         with processor:
             processor.register_documents(
                 [{"resource_id": "doc-001", "document_type": "Note"}],
                 "clinical_note"
             )
-
-            processor.mark_processing("doc-001")
-            processor.mark_failed("doc-001", "API rate limit exceeded")
-            processor.connection.commit()
-
-            # Verify status and error
-            processor.cursor.execute(
-                "SELECT Status, ErrorMessage, RetryCount FROM VectorizationState WHERE DocumentID = 'doc-001'"
-            )
-            row = processor.cursor.fetchone()
-            assert row[0] == "failed"
-            assert "API rate limit" in row[1]
-            assert row[2] == 1  # retry count incremented
+            yield processor
+
+    @pytest.mark.parametrize("transition, expected", [
+        (
+            lambda p: p.mark_processing("doc-001"),
+            {"Status": "processing", "ProcessingStartedAt": NOT_NULL}
+        ),
+        (
+            lambda p: (p.mark_processing("doc-001"), p.mark_completed("doc-001")),
+            {"Status": "completed", "ProcessingCompletedAt": NOT_NULL, "ErrorMessage": None}
+        ),
+        (
+            lambda p: (
+                p.mark_processing("doc-001"),
+                p.mark_failed("doc-001", "API rate limit exceeded")
+            ),
+            {"Status": "failed", "ErrorMessage": "API rate limit exceeded", "RetryCount": 1}
+        ),
+    ], ids=["processing", "completed", "failed"])
+    def test_mark_status(self, registered_doc, transition, expected):
+        """Test marking document as processing, completed or failed."""
+        transition(registered_doc)
+
+        # Verify status and bookkeeping columns changed
+        registered_doc.cursor.execute(
+            f"SELECT {', '.join(expected)} FROM VectorizationState WHERE DocumentID = ?",
+            ("doc-001",)
+        )
+        row = dict(zip(expected, registered_doc.cursor.fetchone()))
+        for column, value in expected.items():
+            if value is NOT_NULL:
+                assert row[column] is not None, column  # timestamp should be set
+            else:
+                assert row[column] == value, column
 
     def test_process_documents_success(self, processor, mock_clients):
         """Test successful document processing."""
         embedding_client, vector_db_client = mock_clients
 
         # Mock successful embedding and insertion
-        embedding_client.embed_batch.return_value = [
-            [0.1] * 1024,
-            [0.2] * 1024
-        ]
+        embedding_client.return_value = [_EMBED_A, _EMBED_B]
 
         with processor:
             documents = [
@@ -307,26 +364,20 @@ class TestBatchProcessor:
             assert stats["total_processed"] == 2
 
             # Verify embeddings were generated
-            embedding_client.embed_batch.assert_called_once()
+            assert embedding_client.calls == 1
 
             # Verify vectors were inserted
-            assert vector_db_client.insert_vector.call_count == 2
+            assert vector_db_client.insert_calls == 2
 
     def test_process_documents_with_failures(self, processor, mock_clients):
         """Test document processing with some failures."""
         embedding_client, vector_db_client = mock_clients
 
         # Mock successful embeddings
-        embedding_client.embed_batch.return_value = [
-            [0.1] * 1024,
-            [0.2] * 1024
-        ]
+        embedding_client.return_value = [_EMBED_A, _EMBED_B]
 
         # Mock vector insertion to fail on second document
-        vector_db_client.insert_vector.side_effect = [
-            None,  # First succeeds
-            Exception("Database connection lost")  # Second fails
-        ]
+        vector_db_client.side_effect = _fail_on_nth(2, "Database connection lost")
 
         with processor:
             documents = [
@@ -356,7 +407,8 @@ class TestBatchProcessor:
 
             # Check database state
             processor.cursor.execute(
-                "SELECT DocumentID, Status FROM VectorizationState WHERE Status='failed'"
+                "SELECT DocumentID, Status FROM VectorizationState WHERE Status = ?",
+                ("failed",)
             )
             failed = processor.cursor.fetchall()
             assert len(failed) == 1
@@ -367,7 +419,7 @@ class TestBatchProcessor:
         embedding_client, vector_db_client = mock_clients
 
         # Mock embedding to fail
-        embedding_client.embed_batch.side_effect = Exception("API unavailable")
+        embedding_client.side_effect = Exception("API unavailable")
 
         with processor:
             documents = [
@@ -392,7 +444,8 @@ class TestBatchProcessor:
 
             # Verify status in database
             processor.cursor.execute(
-                "SELECT Status, ErrorMessage FROM VectorizationState WHERE DocumentID='doc-001'"
+                "SELECT Status, ErrorMessage FROM VectorizationState WHERE DocumentID = ?",
+                ("doc-001",)
             )
             row = processor.cursor.fetchone()
             assert row[0] == "failed"
@@ -406,7 +459,7 @@ class TestBatchProcessor:
             # Register documents
             documents = [
                 {
-                    "resource_id": f"doc-{i:03d}",
+                    "resource_id": _DOC_IDS[i],
                     "patient_id": "patient-123",
                     "document_type": "Note",
                     "text_content": f"Content {i}"
@@ -414,21 +467,12 @@ class TestBatchProcessor:
                 for i in range(5)
             ]
 
+            # Register with some already completed (simulating previous run)
             processor.register_documents(documents, "clinical_note")
-
-            # Manually mark some as completed (simulating previous run)
-            processor.mark_processing("doc-000")
-            processor.mark_completed("doc-000")
-            processor.mark_processing("doc-001")
-            processor.mark_completed("doc-001")
-            processor.connection.commit()
+            _seed_states(processor, ["doc-000", "doc-001"], "completed")
 
             # Mock embeddings for remaining documents
-            embedding_client.embed_batch.return_value = [
-                [0.1] * 1024,
-                [0.2] * 1024,
-                [0.3] * 1024
-            ]
+            embedding_client.return_value = [_EMBED_A, _EMBED_B, _EMBED_C]
 
             # Resume processing
             stats = processor.resume(
@@ -446,18 +490,11 @@ class TestBatchProcessor:
         """Test retrieving processing statistics."""
         with processor:
             # Create documents with different statuses
-            documents = [
-                {"resource_id": f"doc-{i:03d}", "document_type": "Note"}
-                for i in range(10)
-            ]
+            documents = _make_docs(10)
             processor.register_documents(documents, "clinical_note")
 
             # Mark various statuses
-            processor.mark_processing("doc-000")
-            processor.mark_completed("doc-000")
-
-            processor.mark_processing("doc-001")
-            processor.mark_completed("doc-001")
+            _seed_states(processor, ["doc-000", "doc-001"], "completed")
 
             processor.mark_processing("doc-002")
             processor.mark_failed("doc-002", "Error 1")
@@ -466,7 +503,6 @@ class TestBatchProcessor:
             processor.mark_failed("doc-003", "Error 2")
             processor.mark_failed("doc-003", "Error 2 retry")  # increment retry
 
-            processor.connection.commit()
 
             stats = processor.get_statistics()
 
@@ -478,18 +514,11 @@ class TestBatchProcessor:
     def test_reset_failed_documents(self, processor):
         """Test resetting failed documents to pending."""
         with processor:
-            documents = [
-                {"resource_id": f"doc-{i:03d}", "document_type": "Note"}
-                for i in range(5)
-            ]
+            documents = _make_docs(5)
             processor.register_documents(documents, "clinical_note")
 
             # Mark all as failed
-            for doc in documents:
-                processor.mark_processing(doc["resource_id"])
-                processor.mark_failed(doc["resource_id"], "Temporary error")
-
-            processor.connection.commit()
+            _seed_states(processor, _DOC_IDS[:5], "failed")
 
             # Reset failed documents
             reset_count = processor.reset_failed(max_retries=3)
@@ -498,7 +527,8 @@ class TestBatchProcessor:
 
             # Verify all are now pending
             processor.cursor.execute(
-                "SELECT COUNT(*) FROM VectorizationState WHERE Status='pending'"
+                "SELECT COUNT(*) FROM VectorizationState WHERE Status = ?",
+                ("pending",)
             )
             pending_count = processor.cursor.fetchone()[0]
             assert pending_count == 5
@@ -516,11 +546,11 @@ class TestBatchProcessor:
                 processor.mark_processing("doc-001")
                 processor.mark_failed("doc-001", f"Error {i}")
 
-            processor.connection.commit()
 
             # Verify retry count is 4
             processor.cursor.execute(
-                "SELECT RetryCount FROM VectorizationState WHERE DocumentID='doc-001'"
+                "SELECT RetryCount FROM VectorizationState WHERE DocumentID = ?",
+                ("doc-001",)
             )
             assert processor.cursor.fetchone()[0] == 4
 
@@ -537,10 +567,7 @@ class TestBatchProcessor:
         """Test clearing checkpoint database."""
         with processor:
             # Register documents
-            documents = [
-                {"resource_id": f"doc-{i:03d}", "document_type": "Note"}
-                for i in range(5)
-            ]
+            documents = _make_docs(5)
             processor.register_documents(documents, "clinical_note")
 
             # Clear all
@@ -564,7 +591,6 @@ class TestBatchProcessor:
                 [{"resource_id": "img-001", "document_type": "Image"}],
                 "medical_image"
             )
-            processor.connection.commit()
 
             # Clear only clinical notes
             deleted_count = processor.clear_checkpoint("clinical_note")
@@ -572,35 +598,59 @@ class TestBatchProcessor:
             assert deleted_count == 1
 
             # Verify only medical_image remains
-            processor.cursor.execute(
+            rows = set(processor.cursor.execute(
                 "SELECT DocumentID, DocumentType FROM VectorizationState"
-            )
-            rows = processor.cursor.fetchall()
-            assert len(rows) == 1
-            assert rows[0] == ("img-001", "medical_image")
+            ).fetchall())
+            assert rows == {("img-001", "medical_image")}
 
 
-class TestBatchProcessorIntegration:
-    """Integration-style tests for full workflows."""
+@pytest.fixture(scope="class")
+def class_processor(shared_db, shared_processor):
+    """Create one connected BatchProcessor with its schema for a test class."""
+    with BatchProcessor(_StubEmbeddingClient(), _StubVectorDBClient(), shared_db) as proc:
+        yield proc
 
-    @pytest.fixture
-    def mock_clients(self):
-        """Create mock clients with realistic behavior."""
-        embedding_client = Mock()
-        embedding_client.model = "nvidia/nv-embedqa-e5-v5"
 
-        vector_db_client = Mock()
+class TestBatchProcessorReadOnly:
+    """Read-only checks that share one connected processor per class."""
+
+    def test_connect_creates_database(self, class_processor):
+        """Test connect creates checkpoint database."""
+        assert class_processor.connection is not None
+        assert class_processor.cursor is not None
 
-        return embedding_client, vector_db_client
+        # Verify database is open and queryable (file or in-memory backend)
+        class_processor.cursor.execute("SELECT name FROM sqlite_master LIMIT 1")
+
+    def test_create_checkpoint_table(self, class_processor):
+        """Test checkpoint table creation with correct schema."""
+        cursor = class_processor.cursor
+
+        # Verify table was created
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='VectorizationState'"
+        )
+        result = cursor.fetchone()
+        assert result is not None
+
+        # Verify columns (column name is field 1 of table_info rows)
+        cursor.execute("PRAGMA table_info(VectorizationState)")
+        columns = set(map(itemgetter(1), cursor.fetchall()))
+        expected_columns = {
+            "DocumentID", "DocumentType", "Status",
+            "ProcessingStartedAt", "ProcessingCompletedAt",
+            "ErrorMessage", "RetryCount"
+        }
+        assert expected_columns.issubset(columns)
+
+
+class TestBatchProcessorIntegration:
+    """Integration-style tests for full workflows."""
 
     @pytest.fixture
-    def temp_db(self):
-        """Create temporary database."""
-        fd, path = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.remove(path)
+    def mock_clients(self):
+        """Create stub clients with realistic behavior."""
+        return _StubEmbeddingClient(), _StubVectorDBClient()
 
     def test_full_workflow_with_interruption(self, mock_clients, temp_db):
         """Test complete workflow with simulated interruption and resume."""
@@ -608,7 +658,7 @@ class TestBatchProcessorIntegration:
 
         documents = [
             {
-                "resource_id": f"doc-{i:03d}",
+                "resource_id": _DOC_IDS[i],
                 "patient_id": "patient-123",
                 "document_type": "Note",
                 "text_content": f"Clinical note {i}"
@@ -619,21 +669,15 @@ class TestBatchProcessorIntegration:
         # First run: process first 5 documents
         with BatchProcessor(embedding_client, vector_db_client, temp_db) as proc:
             # Mock embeddings
-            embedding_client.embed_batch.return_value = [[0.1] * 1024] * 5
+            embedding_client.return_value = [_EMBED_A] * 5
 
-            # Register all documents
+            # Register all documents, only first 5 processed (simulate interruption)
             proc.register_documents(documents, "clinical_note")
-
-            # Process only first 5 (simulate interruption)
-            first_five = documents[:5]
-            for doc in first_five:
-                proc.mark_processing(doc["resource_id"])
-                proc.mark_completed(doc["resource_id"])
-            proc.connection.commit()
+            _seed_states(proc, _DOC_IDS[:5], "completed")
 
         # Second run: resume and process remaining
         with BatchProcessor(embedding_client, vector_db_client, temp_db) as proc:
-            embedding_client.embed_batch.return_value = [[0.2] * 1024] * 5
+            embedding_client.return_value = [_EMBED_B] * 5
 
             stats = proc.resume(
                 documents,
@@ -646,10 +690,10 @@ class TestBatchProcessorIntegration:
             assert stats["successful"] == 5
             assert stats["total_processed"] == 5
 
-        # Verify all documents are completed
-        with BatchProcessor(embedding_client, vector_db_client, temp_db) as proc:
+            # Verify all documents are completed
             proc.cursor.execute(
-                "SELECT COUNT(*) FROM VectorizationState WHERE Status='completed'"
+                "SELECT COUNT(*) FROM VectorizationState WHERE Status = ?",
+                ("completed",)
             )
             assert proc.cursor.fetchone()[0] == 10
 
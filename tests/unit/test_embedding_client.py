@@ -7,23 +7,97 @@ Validates retry logic, rate limiting, and batch processing.
 Usage:
     pytest tests/unit/test_embedding_client.py -v
     pytest tests/unit/test_embedding_client.py::TestNVIDIAEmbeddingsClient::test_embed -v
+    pytest tests/unit/test_embedding_client.py -n auto   # parallel, needs pytest-xdist
+
+All HTTP calls and sleeps are mocked and environment changes go through
+monkeypatch, so tests are independent and safe to spread across xdist
+workers (each worker builds its own class-scoped client).
 
 Dependencies:
-    pytest, unittest.mock
+    pytest, unittest.mock, pytest-xdist (optional)
 """
 
 import pytest
-import sys
-import time
-from pathlib import Path
-from unittest.mock import Mock, MagicMock, patch, call
+import requests
+from unittest.mock import Mock, patch
 import os
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
+from vectorization import embedding_client as _ec_mod
 from vectorization.embedding_client import NVIDIAEmbeddingsClient, RateLimitError
 
+# Fake 1024-dim embeddings shared by all mocked API responses; the client
+# passes them through without copying or mutating them
+_EMB_1024 = [0.1] * 1024
+_EMB_1024_B = [0.2] * 1024
+_EMB_0_123 = [0.123] * 1024
+
+_API_KEY = "nvapi-test-key-1234567890"
+
+
+def _resp(status=200, n=1, payload=None, retry_after=None, raises=None, text=""):
+    """
+    Build a mocked API response.
+
+    By default a 200 carrying n shared embeddings. The spec limits the mock
+    to the attributes the client reads, so unknown attributes are not
+    auto-created.
+    """
+    response = Mock(spec=["status_code", "json", "headers", "raise_for_status", "text"])
+    response.status_code = status
+    response.json.return_value = (
+        payload if payload is not None else {"data": [{"embedding": _EMB_1024}] * n}
+    )
+    response.headers = {"Retry-After": str(retry_after)} if retry_after else {}
+    response.text = text
+    if raises:
+        response.raise_for_status.side_effect = raises
+    return response
+
+
+def _server_error_resp():
+    """Build a 500 response whose raise_for_status() raises HTTPError."""
+    return _resp(500, text="Internal Server Error", raises=requests.exceptions.HTTPError())
+
+
+@pytest.fixture(autouse=True)
+def mock_sleep(monkeypatch):
+    """
+    Replace time.sleep for every test.
+
+    Rate limiting, Retry-After handling and tenacity's backoff all sleep
+    through it; tests that check the waits request this fixture.
+    """
+    sleep = Mock()
+    monkeypatch.setattr(_ec_mod.time, "sleep", sleep)
+    return sleep
+
+
+@pytest.fixture(scope="class")
+def client():
+    """
+    Create one test client per test class.
+
+    Building a client opens a requests.Session; per-test mutable state is
+    reset by the class's reset_client fixture.
+    """
+    client = NVIDIAEmbeddingsClient(
+        api_key=_API_KEY,
+        model="nvidia/nv-embedqa-e5-v5",
+        batch_size=50,
+        requests_per_minute=60,
+        max_retries=3
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def mock_post(monkeypatch):
+    """Patch requests.Session.post and return the mock."""
+    post = Mock()
+    monkeypatch.setattr(_ec_mod.requests.Session, "post", post)
+    return post
+
 
 class TestNVIDIAEmbeddingsClient:
     """Test suite for NVIDIAEmbeddingsClient class."""
@@ -31,31 +105,23 @@ class TestNVIDIAEmbeddingsClient:
     @pytest.fixture
     def api_key(self):
         """Test API key."""
-        return "nvapi-test-key-1234567890"
+        return _API_KEY
 
-    @pytest.fixture
-    def client(self, api_key):
-        """Create a test client instance."""
-        return NVIDIAEmbeddingsClient(
-            api_key=api_key,
-            model="nvidia/nv-embedqa-e5-v5",
-            batch_size=50,
-            requests_per_minute=60,
-            max_retries=3
-        )
+    @pytest.fixture(autouse=True)
+    def reset_client(self, client):
+        """Restore the shared client's mutable state before each test."""
+        client.last_request_time = 0.0
+        client.batch_size = 50
 
     @pytest.fixture
     def mock_response(self):
         """Create a mock successful API response."""
-        mock_resp = Mock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
+        return _resp(payload={
             "data": [
-                {"embedding": [0.1] * 1024},
-                {"embedding": [0.2] * 1024}
+                {"embedding": _EMB_1024},
+                {"embedding": _EMB_1024_B}
             ]
-        }
-        return mock_resp
+        })
 
     def test_initialization_with_api_key(self, api_key):
         """Test client initialization with explicit API key."""
@@ -100,33 +166,34 @@ class TestNVIDIAEmbeddingsClient:
         )
         assert client2.min_interval == 2.0
 
-    @patch('vectorization.embedding_client.time.sleep')
-    def test_wait_for_rate_limit(self, mock_sleep, client):
+    @pytest.fixture
+    def frozen_time(self, monkeypatch):
+        """Pin the client's clock at t=1000s so rate-limit waits are exact."""
+        monkeypatch.setattr(_ec_mod.time, "time", lambda: 1000.0)
+        return 1000.0
+
+    def test_wait_for_rate_limit(self, mock_sleep, client, frozen_time):
         """Test rate limiting waits when necessary."""
         # Set last request to recent time
-        client.last_request_time = time.time() - 0.5  # 0.5 seconds ago
+        client.last_request_time = frozen_time - 0.5  # 0.5 seconds ago
 
         client._wait_for_rate_limit()
 
-        # Should have waited ~0.5 seconds (1.0 - 0.5)
+        # Should have waited 0.5 seconds (1.0 - 0.5)
         mock_sleep.assert_called_once()
-        wait_time = mock_sleep.call_args[0][0]
-        assert 0.4 < wait_time < 0.6
+        assert mock_sleep.call_args[0][0] == pytest.approx(0.5)
 
-    @patch('vectorization.embedding_client.time.sleep')
-    def test_no_wait_when_interval_passed(self, mock_sleep, client):
+    def test_no_wait_when_interval_passed(self, mock_sleep, client, frozen_time):
         """Test no waiting when rate limit interval has passed."""
         # Set last request to long ago
-        client.last_request_time = time.time() - 2.0  # 2 seconds ago
+        client.last_request_time = frozen_time - 2.0  # 2 seconds ago
 
         client._wait_for_rate_limit()
 
         # Should not have slept
         mock_sleep.assert_not_called()
 
-    @patch('vectorization.embedding_client.requests.Session.post')
-    @patch('vectorization.embedding_client.time.sleep')
-    def test_make_request_success(self, mock_sleep, mock_post, client, mock_response):
+    def test_make_request_success(self, mock_post, client, mock_response):
         """Test successful API request."""
         mock_post.return_value = mock_response
 
@@ -135,8 +202,8 @@ class TestNVIDIAEmbeddingsClient:
 
         assert len(embeddings) == 2
         assert len(embeddings[0]) == 1024
-        assert embeddings[0] == [0.1] * 1024
-        assert embeddings[1] == [0.2] * 1024
+        assert embeddings[0] is _EMB_1024
+        assert embeddings[1] is _EMB_1024_B
 
         # Verify request was made correctly
         mock_post.assert_called_once()
@@ -145,141 +212,73 @@ class TestNVIDIAEmbeddingsClient:
         assert call_kwargs["json"]["model"] == "nvidia/nv-embedqa-e5-v5"
         assert call_kwargs["timeout"] == 30
 
-    @patch('vectorization.embedding_client.requests.Session.post')
-    @patch('vectorization.embedding_client.time.sleep')
-    def test_make_request_rate_limit_429(self, mock_sleep, mock_post, client):
-        """Test handling of 429 rate limit response."""
-        # First call returns 429, second call succeeds
-        rate_limit_response = Mock()
-        rate_limit_response.status_code = 429
-        rate_limit_response.headers = {"Retry-After": "5"}
-
-        success_response = Mock()
-        success_response.status_code = 200
-        success_response.json.return_value = {
-            "data": [{"embedding": [0.1] * 1024}]
-        }
-
-        mock_post.side_effect = [rate_limit_response, success_response]
+    @pytest.mark.parametrize("responses, expected_posts, expected_raises, expected_sleeps", [
+        # 429 with Retry-After, then success: sleeps Retry-After and retries
+        (lambda: [_resp(429, retry_after=5), _resp()], 2, None, [5]),
+        # HTTP 500 on every attempt: retried until tenacity gives up
+        (lambda: [_server_error_resp()] * 3, 3, requests.exceptions.HTTPError, []),
+        # Connection error, then success: retried once
+        (
+            lambda: [requests.exceptions.ConnectionError("Connection failed"), _resp()],
+            2, None, []
+        ),
+    ], ids=["rate_limit_429", "http_error", "connection_error_retry"])
+    def test_make_request_error_handling(
+        self, mock_post, mock_sleep, client,
+        responses, expected_posts, expected_raises, expected_sleeps
+    ):
+        """Test retry and error handling for failed API requests."""
+        mock_post.side_effect = responses()
 
         texts = ["Test text"]
-        embeddings = client._make_request(texts)
-
-        # Should have slept for retry-after duration
-        assert mock_sleep.call_count >= 1
-        # First sleep is from rate limit response
-        first_sleep = [c for c in mock_sleep.call_args_list if c[0][0] == 5]
-        assert len(first_sleep) == 1
-
-        # Should have retried and succeeded
-        assert len(embeddings) == 1
-        assert mock_post.call_count == 2
-
-    @patch('vectorization.embedding_client.requests.Session.post')
-    @patch('vectorization.embedding_client.time.sleep')
-    def test_make_request_http_error(self, mock_sleep, mock_post, client):
-        """Test handling of HTTP errors."""
-        import requests
-
-        error_response = Mock()
-        error_response.status_code = 500
-        error_response.text = "Internal Server Error"
-        error_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-
-        mock_post.return_value = error_response
-
-        texts = ["Test text"]
-
-        with pytest.raises(requests.exceptions.HTTPError):
-            client._make_request(texts)
-
-    @patch('vectorization.embedding_client.requests.Session.post')
-    @patch('vectorization.embedding_client.time.sleep')
-    def test_make_request_connection_error_retry(self, mock_sleep, mock_post, client):
-        """Test retry logic for connection errors."""
-        import requests
-
-        # Simulate connection error then success
-        success_response = Mock()
-        success_response.status_code = 200
-        success_response.json.return_value = {
-            "data": [{"embedding": [0.1] * 1024}]
-        }
-
-        mock_post.side_effect = [
-            requests.exceptions.ConnectionError("Connection failed"),
-            success_response
-        ]
-
-        texts = ["Test text"]
-        embeddings = client._make_request(texts)
-
-        # Should have retried and succeeded
-        assert len(embeddings) == 1
-        assert mock_post.call_count == 2
-
-    @patch('vectorization.embedding_client.requests.Session.post')
-    @patch('vectorization.embedding_client.time.sleep')
-    def test_embed_single_text(self, mock_sleep, mock_post, client):
+        if expected_raises:
+            with pytest.raises(expected_raises):
+                client._make_request(texts)
+        else:
+            embeddings = client._make_request(texts)
+            # Should have retried and succeeded
+            assert len(embeddings) == 1
+
+        assert mock_post.call_count == expected_posts
+        sleeps = [c[0][0] for c in mock_sleep.call_args_list]
+        for duration in expected_sleeps:
+            assert sleeps.count(duration) == 1
+
+    def test_embed_single_text(self, mock_post, client):
         """Test embedding a single text."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": [{"embedding": [0.123] * 1024}]
-        }
-        mock_post.return_value = mock_response
+        mock_post.return_value = _resp(payload={"data": [{"embedding": _EMB_0_123}]})
 
         text = "Patient presents with acute symptoms"
         embedding = client.embed(text)
 
         assert len(embedding) == 1024
-        assert embedding == [0.123] * 1024
+        assert embedding is _EMB_0_123
 
         # Verify single text was sent
         call_kwargs = mock_post.call_args[1]
         assert call_kwargs["json"]["input"] == [text]
 
-    @patch('vectorization.embedding_client.requests.Session.post')
-    @patch('vectorization.embedding_client.time.sleep')
-    def test_embed_batch(self, mock_sleep, mock_post, client):
+    def test_embed_batch(self, mock_post, client):
         """Test batch embedding."""
         # Mock response for batch
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": [
-                {"embedding": [0.1 + i * 0.01] * 1024}
-                for i in range(5)
-            ]
-        }
-        mock_post.return_value = mock_response
+        mock_post.return_value = _resp(n=5)
 
         texts = [f"Text {i}" for i in range(5)]
         embeddings = client.embed_batch(texts, show_progress=False)
 
         assert len(embeddings) == 5
-        assert all(len(emb) == 1024 for emb in embeddings)
+        assert len(embeddings[0]) == 1024
+        assert all(emb is _EMB_1024 for emb in embeddings)
 
         # Verify batch was sent in single request
         mock_post.assert_called_once()
 
-    @patch('vectorization.embedding_client.requests.Session.post')
-    @patch('vectorization.embedding_client.time.sleep')
-    def test_embed_batch_multiple_batches(self, mock_sleep, mock_post, client):
+    def test_embed_batch_multiple_batches(self, mock_post, client):
         """Test batch embedding splits into multiple requests."""
         client.batch_size = 3  # Small batch size
 
-        # Mock responses for multiple batches
-        def mock_response_factory(request_data):
-            response = Mock()
-            response.status_code = 200
-            num_texts = len(request_data["json"]["input"])
-            response.json.return_value = {
-                "data": [{"embedding": [0.1] * 1024} for _ in range(num_texts)]
-            }
-            return response
-
-        mock_post.side_effect = lambda *args, **kwargs: mock_response_factory(kwargs)
+        # Mock responses for multiple batches, built up front
+        mock_post.side_effect = [_resp(n=3), _resp(n=3), _resp()]
 
         # 7 texts with batch size 3 = 3 batches (3, 3, 1)
         texts = [f"Text {i}" for i in range(7)]
@@ -295,31 +294,13 @@ class TestNVIDIAEmbeddingsClient:
         ]
         assert batch_sizes == [3, 3, 1]
 
-    @patch('vectorization.embedding_client.requests.Session.post')
-    @patch('vectorization.embedding_client.time.sleep')
-    def test_embed_batch_failure_propagates(self, mock_sleep, mock_post, client):
+    def test_embed_batch_failure_propagates(self, mock_post, client):
         """Test batch embedding propagates failures."""
-        import requests
-
         # First batch succeeds, second fails (with retries)
-        success_response = Mock()
-        success_response.status_code = 200
-        success_response.json.return_value = {
-            "data": [{"embedding": [0.1] * 1024} for _ in range(3)]
-        }
-
-        error_response = Mock()
-        error_response.status_code = 500
-        error_response.text = "Internal Server Error"
-        error_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+        error_response = _server_error_resp()
 
         # Need enough responses for: 1 success + 3 retries of failure
-        mock_post.side_effect = [
-            success_response,
-            error_response,
-            error_response,
-            error_response,
-        ]
+        mock_post.side_effect = [_resp(n=3)] + [error_response] * 3
 
         client.batch_size = 3
         texts = [f"Text {i}" for i in range(6)]  # 2 batches
@@ -333,8 +314,10 @@ class TestNVIDIAEmbeddingsClient:
 
     def test_context_manager(self, api_key):
         """Test using client as context manager."""
-        with patch('vectorization.embedding_client.requests.Session') as mock_session:
-            mock_session_instance = MagicMock()
+        with patch.object(_ec_mod.requests, "Session") as mock_session:
+            # Only close() and the headers the client updates are needed
+            mock_session_instance = Mock(spec=["close", "headers"])
+            mock_session_instance.headers = {}
             mock_session.return_value = mock_session_instance
 
             with NVIDIAEmbeddingsClient(api_key=api_key) as client:
@@ -343,16 +326,9 @@ class TestNVIDIAEmbeddingsClient:
             # Verify session was closed
             mock_session_instance.close.assert_called_once()
 
-    @patch('vectorization.embedding_client.requests.Session.post')
-    @patch('vectorization.embedding_client.time.sleep')
-    def test_session_reuse(self, mock_sleep, mock_post, client):
+    def test_session_reuse(self, mock_post, client):
         """Test that session is reused across requests."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": [{"embedding": [0.1] * 1024}]
-        }
-        mock_post.return_value = mock_response
+        mock_post.return_value = _resp()
 
         # Make multiple requests
         client.embed("Text 1")
@@ -373,44 +349,25 @@ class TestNVIDIAEmbeddingsClientIntegration:
     def api_key(self):
         return "nvapi-test-key"
 
-    @patch('vectorization.embedding_client.requests.Session.post')
-    @patch('vectorization.embedding_client.time.sleep')
-    def test_full_batch_workflow(self, mock_sleep, mock_post, api_key):
+    def test_full_batch_workflow(self, mock_post, api_key):
         """Test complete workflow: init, batch embed, close."""
         # Mock successful responses
-        def create_response(num_texts):
-            response = Mock()
-            response.status_code = 200
-            response.json.return_value = {
-                "data": [{"embedding": [0.1] * 1024} for _ in range(num_texts)]
-            }
-            return response
-
-        mock_post.side_effect = [
-            create_response(3),
-            create_response(2)
-        ]
+        mock_post.side_effect = [_resp(n=3), _resp(n=2)]
 
         with NVIDIAEmbeddingsClient(api_key=api_key, batch_size=3) as client:
             texts = [f"Clinical note {i}" for i in range(5)]
             embeddings = client.embed_batch(texts, show_progress=False)
 
             assert len(embeddings) == 5
-            assert all(len(emb) == 1024 for emb in embeddings)
+            assert len(embeddings[0]) == 1024
+            assert all(emb is _EMB_1024 for emb in embeddings)
 
         # Session should be closed
         assert mock_post.call_count == 2
 
-    @patch('vectorization.embedding_client.requests.Session.post')
-    @patch('vectorization.embedding_client.time.sleep')
-    def test_rate_limiting_in_batch(self, mock_sleep, mock_post, api_key):
+    def test_rate_limiting_in_batch(self, mock_post, mock_sleep, api_key):
         """Test that rate limiting is applied across batch requests."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": [{"embedding": [0.1] * 1024}]
-        }
-        mock_post.return_value = mock_response
+        mock_post.return_value = _resp()
 
         client = NVIDIAEmbeddingsClient(
             api_key=api_key,
@@ -12,6 +12,7 @@ Dependencies:
     pytest, unittest.mock
 """
 
+import numpy as np
 import pytest
 import sys
 from pathlib import Path
@@ -21,7 +22,10 @@ from typing import List
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-from src.vectorization.vector_db_client import IRISVectorDBClient
+from src.vectorization.vector_db_client import (
+    AsyncIRISVectorDBClient,
+    IRISVectorDBClient,
+)
 
 
 class TestIRISVectorDBClient:
@@ -108,6 +112,84 @@ class TestIRISVectorDBClient:
         mock_cursor.close.assert_called_once()
         mock_conn.close.assert_called_once()
 
+    def test_pooled_disconnect_returns_connection(self, mock_iris_module):
+        """Test pooled clients close the cursor but keep the connection."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+        client = IRISVectorDBClient(pool_enabled=True)
+
+        try:
+            with client:
+                assert client.connection is mock_conn
+
+            mock_cursor.close.assert_called_once()
+            mock_conn.rollback.assert_called_once()
+            mock_conn.close.assert_not_called()
+            assert client.connection is None
+
+            # A second client with the same settings reuses the connection
+            other = IRISVectorDBClient(pool_enabled=True)
+            other.connect()
+            assert other.connection is mock_conn
+            mock_db_class.get_connection.assert_called_once()
+            other.disconnect()
+        finally:
+            IRISVectorDBClient.close_pool()
+
+        mock_conn.close.assert_called_once()
+
+    def test_pooled_disconnect_discards_connection_when_rollback_fails(self, mock_iris_module):
+        """Test a dead pooled connection is closed, not pooled, and the body error survives."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+        mock_conn.rollback.side_effect = Exception("Connection lost")
+        client = IRISVectorDBClient(pool_enabled=True)
+
+        try:
+            with pytest.raises(ValueError, match="query failed"):
+                with client:
+                    raise ValueError("query failed")
+
+            mock_conn.close.assert_called_once()
+            assert client.connection is None
+            assert client.cursor is None
+
+            # Nothing was pooled, so the next client opens a fresh connection
+            IRISVectorDBClient(pool_enabled=True).connect()
+            assert mock_db_class.get_connection.call_count == 2
+        finally:
+            IRISVectorDBClient.close_pool()
+
+    def test_stale_pooled_connection_is_replaced(self, mock_iris_module):
+        """Test a pooled connection that fails the liveness check is not reused."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+        client = IRISVectorDBClient(pool_enabled=True)
+
+        try:
+            with client:
+                pass
+            mock_cursor.execute.side_effect = Exception("Connection lost")
+
+            client.connect()
+
+            mock_cursor.execute.assert_called_once_with("SELECT 1")
+            mock_conn.close.assert_called_once()
+            assert mock_db_class.get_connection.call_count == 2
+        finally:
+            IRISVectorDBClient.close_pool()
+
+    def test_pool_keyed_on_connection_settings(self, mock_iris_module):
+        """Test pooled connections are not shared across namespaces."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+
+        try:
+            with IRISVectorDBClient(pool_enabled=True):
+                pass
+            with IRISVectorDBClient(namespace="USER", pool_enabled=True):
+                pass
+        finally:
+            IRISVectorDBClient.close_pool()
+
+        assert mock_db_class.get_connection.call_count == 2
+
     def test_create_table_success(self, client, mock_iris_module):
         """Test creating ClinicalNoteVectors table."""
         mock_db_class, mock_conn, mock_cursor = mock_iris_module
@@ -128,6 +210,55 @@ class TestIRISVectorDBClient:
         assert "CREATE TABLE" in create_sql
         assert "VECTOR(DOUBLE, 1024)" in create_sql
 
+        # HNSW index is built on the Embedding column
+        index_sql = mock_cursor.execute.call_args_list[1][0][0]
+        assert "CREATE INDEX ClinicalNoteVectorsHNSW" in index_sql
+        assert "(Embedding)" in index_sql
+        assert "AS HNSW(Distance='Cosine', M=16, efConstruction=64)" in index_sql
+
+    def test_create_table_survives_hnsw_failure(self, client, mock_iris_module):
+        """Test a failed HNSW index build still leaves the table created."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+        client.connect()
+        mock_cursor.execute.side_effect = [None, Exception("HNSW not supported")]
+
+        client.create_clinical_note_vectors_table()
+
+        assert "CREATE TABLE" in mock_cursor.execute.call_args_list[0][0][0]
+        mock_conn.commit.assert_called_once()
+        mock_conn.rollback.assert_called_once()
+
+    def test_create_table_without_hnsw_index(self, client, mock_iris_module):
+        """Test skipping the HNSW index."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+        client.connect()
+
+        client.create_clinical_note_vectors_table(hnsw_index=False)
+
+        mock_cursor.execute.assert_called_once()
+        assert "CREATE INDEX" not in mock_cursor.execute.call_args[0][0]
+
+    @pytest.mark.parametrize("dtype,column", [
+        ("double", "VECTOR(DOUBLE, 1024)"),
+        ("float", "VECTOR(FLOAT, 1024)"),
+    ])
+    def test_create_table_dtype(self, mock_iris_module, dtype, column):
+        """Test the Embedding column follows the configured dtype."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+        client = IRISVectorDBClient(dtype=dtype)
+        client.connect()
+
+        client.create_clinical_note_vectors_table(hnsw_index=False)
+
+        create_sql = mock_cursor.execute.call_args[0][0]
+        assert column in create_sql
+
+    @pytest.mark.parametrize("dtype", ["half", "int8"])
+    def test_invalid_dtype(self, dtype):
+        """Test an unknown dtype is rejected at construction."""
+        with pytest.raises(ValueError, match="Unsupported vector dtype"):
+            IRISVectorDBClient(dtype=dtype)
+
     def test_create_table_drop_if_exists(self, client, mock_iris_module):
         """Test dropping existing table before creation."""
         mock_db_class, mock_conn, mock_cursor = mock_iris_module
@@ -177,6 +308,25 @@ class TestIRISVectorDBClient:
 
         mock_conn.commit.assert_called_once()
 
+    def test_insert_vector_numpy_embedding(self, client, mock_iris_module):
+        """Test numpy embeddings serialize to the same literal as lists."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+        client.connect()
+
+        embedding = np.linspace(-1.0, 1.0, 1024)
+        for value in (embedding, embedding.tolist(), list(embedding)):
+            client.insert_vector(
+                resource_id="doc-123",
+                patient_id="patient-456",
+                document_type="Progress Note",
+                text_content="Test content",
+                embedding=value,
+                embedding_model="test-model"
+            )
+
+        literals = {c[0][1][5] for c in mock_cursor.execute.call_args_list}
+        assert literals == {"[" + ",".join(map(str, embedding.tolist())) + "]"}
+
     def test_insert_vector_dimension_mismatch(self, client, mock_iris_module):
         """Test vector insertion with wrong dimension."""
         mock_db_class, mock_conn, mock_cursor = mock_iris_module
@@ -217,7 +367,110 @@ class TestIRISVectorDBClient:
 
         assert success_count == 3
         assert failed_count == 0
-        assert mock_cursor.execute.call_count == 3
+
+        # One executemany round trip and one commit for the whole batch
+        mock_cursor.execute.assert_not_called()
+        mock_cursor.executemany.assert_called_once()
+        insert_sql, params = mock_cursor.executemany.call_args[0]
+        assert "INSERT INTO SQLUser.ClinicalNoteVectors" in insert_sql
+        assert [row[0] for row in params] == ["doc-0", "doc-1", "doc-2"]
+        assert params[0][4] == "bundle-0.json"
+        mock_conn.commit.assert_called_once()
+
+    def test_insert_vectors_batch_dimension_mismatch(self, client, mock_iris_module):
+        """Test batch insertion rejects bad dimensions before touching the DB."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+        client.connect()
+
+        vectors = [
+            {
+                "resource_id": f"doc-{i}",
+                "patient_id": "patient-123",
+                "document_type": "Progress Note",
+                "text_content": f"Content {i}",
+                "embedding": [0.1] * dim,
+                "embedding_model": "nvidia/nv-embedqa-e5-v5"
+            }
+            for i, dim in enumerate([1024, 512])
+        ]
+
+        with pytest.raises(ValueError, match="doc-1"):
+            client.insert_vectors_batch(vectors)
+
+        mock_cursor.executemany.assert_not_called()
+        mock_cursor.execute.assert_not_called()
+
+    def test_insert_vectors_batch_uniform_wrong_dimension(self, client, mock_iris_module):
+        """Test a non-ragged batch with the wrong width fails the shape check."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+        client.connect()
+
+        vectors = [
+            {
+                "resource_id": f"doc-{i}",
+                "patient_id": "patient-123",
+                "document_type": "Progress Note",
+                "text_content": f"Content {i}",
+                "embedding": [0.1] * 512,
+                "embedding_model": "nvidia/nv-embedqa-e5-v5"
+            }
+            for i in range(2)
+        ]
+
+        with pytest.raises(ValueError, match="Vector dimension mismatch for doc-0"):
+            client.insert_vectors_batch(vectors)
+
+        mock_cursor.executemany.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_insert_vectors_batch_async(self, client, mock_iris_module):
+        """Test async batch insertion splits the batch into chunks."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+
+        vectors = [
+            {
+                "resource_id": f"doc-{i}",
+                "patient_id": "patient-123",
+                "document_type": "Progress Note",
+                "text_content": f"Content {i}",
+                "embedding": [0.1] * 1024,
+                "embedding_model": "nvidia/nv-embedqa-e5-v5"
+            }
+            for i in range(5)
+        ]
+
+        success_count, failed_count = await client.insert_vectors_batch_async(
+            vectors, concurrency=2, chunk_size=2
+        )
+
+        assert (success_count, failed_count) == (5, 0)
+        # One connection and one executemany per chunk of <= 2 rows
+        assert mock_db_class.get_connection.call_count == 3
+        assert sorted(
+            len(c[0][1]) for c in mock_cursor.executemany.call_args_list
+        ) == [1, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_insert_vectors_batch_async_dimension_mismatch(self, client, mock_iris_module):
+        """Test async batch insertion validates the whole batch first."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+
+        vectors = [
+            {
+                "resource_id": f"doc-{i}",
+                "patient_id": "patient-123",
+                "document_type": "Progress Note",
+                "text_content": f"Content {i}",
+                "embedding": [0.1] * dim,
+                "embedding_model": "nvidia/nv-embedqa-e5-v5"
+            }
+            for i, dim in enumerate([1024, 1024, 1024, 8])
+        ]
+
+        with pytest.raises(ValueError, match="doc-3"):
+            await client.insert_vectors_batch_async(vectors, chunk_size=2)
+
+        mock_db_class.get_connection.assert_not_called()
 
     def test_search_similar_success(self, client, mock_iris_module):
         """Test successful similarity search."""
@@ -242,9 +495,15 @@ class TestIRISVectorDBClient:
 
         # Verify query was executed
         mock_cursor.execute.assert_called_once()
-        query_sql = mock_cursor.execute.call_args[0][0]
-        assert "SELECT TOP" in query_sql
-        assert "VECTOR_COSINE" in query_sql
+        query_sql, params = mock_cursor.execute.call_args[0]
+        assert "SELECT TOP 2" in query_sql
+        assert "VECTOR_COSINE(Embedding, TO_VECTOR(?, DOUBLE)) AS Similarity" in query_sql
+        assert "ORDER BY Similarity DESC" in query_sql
+
+        # Query vector is bound, not inlined into the SQL text
+        vector_str = "[" + ",".join(["0.1"] * 1024) + "]"
+        assert vector_str not in query_sql
+        assert params == [vector_str]
 
     def test_search_similar_with_filters(self, client, mock_iris_module):
         """Test similarity search with patient and document type filters."""
@@ -271,8 +530,37 @@ class TestIRISVectorDBClient:
 
         # Verify filter parameters
         params = mock_cursor.execute.call_args[0][1]
-        assert "patient-123" in params
-        assert "Progress Note" in params
+        assert params[1:3] == ["patient-123", "Progress Note"]
+
+    def test_search_similar_reuses_statement(self, client, mock_iris_module):
+        """Test repeated searches of the same shape share one SQL string."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+        client.connect()
+        mock_cursor.fetchall.return_value = []
+
+        client.search_similar([0.1] * 1024, top_k=5, patient_id="patient-1")
+        first_sql = mock_cursor.execute.call_args[0][0]
+        client.search_similar([0.2] * 1024, top_k=5, patient_id="patient-2")
+        second_sql = mock_cursor.execute.call_args[0][0]
+
+        assert second_sql is first_sql
+
+    def test_search_similar_images_binds_vector(self, client, mock_iris_module):
+        """Test image search binds the query vector instead of inlining it."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+        client.connect()
+        mock_cursor.fetchall.return_value = [
+            ("img-1", "patient-123", "CT", "/img/1.dcm", None, 0.9)
+        ]
+
+        results = client.search_similar_images([0.1] * 1024, top_k=3, study_type="CT")
+
+        query_sql, params = mock_cursor.execute.call_args[0]
+        vector_str = "[" + ",".join(["0.1"] * 1024) + "]"
+        assert vector_str not in query_sql
+        assert "StudyType = ?" in query_sql
+        assert params == [vector_str, "CT"]
+        assert results[0]["image_id"] == "img-1"
 
     def test_search_similar_dimension_mismatch(self, client, mock_iris_module):
         """Test search with wrong vector dimension."""
@@ -284,6 +572,44 @@ class TestIRISVectorDBClient:
         with pytest.raises(ValueError, match="Query vector dimension mismatch"):
             client.search_similar(wrong_query_vector)
 
+    def test_search_similar_local(self, client, mock_iris_module):
+        """Test client-side cosine ranking over fetched candidates."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+        client.connect()
+
+        query_vector = [1.0] + [0.0] * 1023
+        close = ",".join(["0.9", "0.1"] + ["0"] * 1022)
+        exact = [2.0] + [0.0] * 1023          # same direction, different norm
+        orthogonal = [0.0, 1.0] + [0.0] * 1022
+        zero = [0.0] * 1024
+        mock_cursor.fetchall.return_value = [
+            ("doc-far", "patient-123", "Progress Note", "c", None, orthogonal),
+            ("doc-close", "patient-123", "Progress Note", "b", None, close),
+            ("doc-zero", "patient-123", "Progress Note", "d", None, zero),
+            ("doc-exact", "patient-123", "Progress Note", "a", None, exact),
+        ]
+
+        results = client.search_similar_local(
+            query_vector, top_k=2, patient_id="patient-123"
+        )
+
+        assert [r["resource_id"] for r in results] == ["doc-exact", "doc-close"]
+        assert results[0]["similarity"] == pytest.approx(1.0, abs=1e-5)
+        assert results[1]["similarity"] == pytest.approx(0.9 / (0.82 ** 0.5), abs=1e-5)
+
+        query_sql, params = mock_cursor.execute.call_args[0]
+        assert "VECTOR_COSINE" not in query_sql
+        assert "PatientID = ?" in query_sql
+        assert params == ["patient-123"]
+
+    def test_search_similar_local_no_candidates(self, client, mock_iris_module):
+        """Test local search over an empty candidate set."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+        client.connect()
+        mock_cursor.fetchall.return_value = []
+
+        assert client.search_similar_local([0.1] * 1024) == []
+
     def test_count_vectors(self, client, mock_iris_module):
         """Test counting vectors in table."""
         mock_db_class, mock_conn, mock_cursor = mock_iris_module
@@ -303,17 +629,12 @@ class TestIRISVectorDBClient:
         mock_db_class, mock_conn, mock_cursor = mock_iris_module
         client.connect()
 
-        # Mock count query
-        mock_cursor.fetchone.side_effect = [
-            (1500,),  # total count
-            (250,)    # unique patients
-        ]
-
-        # Mock document type breakdown
+        # Single aggregate query: patient count row plus per-type rows
         mock_cursor.fetchall.return_value = [
-            ("Progress Note", 800),
-            ("Discharge Summary", 400),
-            ("Consultation", 300)
+            ("type", "Discharge Summary", 400),
+            ("patients", None, 250),
+            ("type", "Progress Note", 800),
+            ("type", "Consultation", 300)
         ]
 
         stats = client.get_vector_stats("ClinicalNoteVectors")
@@ -323,6 +644,62 @@ class TestIRISVectorDBClient:
         assert stats["unique_document_types"] == 3
         assert stats["document_type_counts"]["Progress Note"] == 800
         assert stats["document_type_counts"]["Discharge Summary"] == 400
+        assert list(stats["document_type_counts"]) == [
+            "Progress Note", "Discharge Summary", "Consultation"
+        ]
+
+        mock_cursor.execute.assert_called_once()
+        mock_cursor.fetchone.assert_not_called()
+        query_sql = mock_cursor.execute.call_args[0][0]
+        assert "COUNT(DISTINCT PatientID)" in query_sql
+        assert "UNION ALL" in query_sql
+
+
+class TestAsyncIRISVectorDBClient:
+    """Test suite for the asyncio wrapper."""
+
+    @pytest.fixture
+    def mock_iris_module(self):
+        """Mock the DatabaseConnection."""
+        with patch('src.db.connection.DatabaseConnection') as mock_db_class:
+            mock_conn = MagicMock()
+            mock_cursor = MagicMock()
+            mock_conn.cursor.return_value = mock_cursor
+            mock_db_class.get_connection.return_value = mock_conn
+            yield mock_db_class, mock_conn, mock_cursor
+
+    @pytest.mark.asyncio
+    async def test_insert_and_search(self, mock_iris_module):
+        """Test async calls delegate to the sync client and clean up."""
+        mock_db_class, mock_conn, mock_cursor = mock_iris_module
+        mock_cursor.fetchall.return_value = [
+            ("doc-1", "patient-123", "Progress Note", "Content 1", None, 0.95)
+        ]
+
+        async with AsyncIRISVectorDBClient(vector_dimension=4) as client:
+            await client.insert_vector(
+                resource_id="doc-1",
+                patient_id="patient-123",
+                document_type="Progress Note",
+                text_content="Content 1",
+                embedding=[0.1] * 4,
+                embedding_model="test-model"
+            )
+            results = await client.search_similar([0.1] * 4, top_k=1)
+
+        assert results[0]["resource_id"] == "doc-1"
+        assert "INSERT INTO" in mock_cursor.execute.call_args_list[0][0][0]
+        mock_conn.commit.assert_called_once()
+        mock_conn.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_dimension_mismatch_propagates(self, mock_iris_module):
+        """Test errors raised in the worker thread reach the caller."""
+        client = AsyncIRISVectorDBClient(vector_dimension=4)
+        await client.connect()
+
+        with pytest.raises(ValueError, match="Query vector dimension mismatch"):
+            await client.search_similar([0.1] * 3)
 
 
 class TestIRISVectorDBClientIntegration:
@@ -371,8 +748,10 @@ class TestIRISVectorDBClientIntegration:
             assert len(results) == 1
 
             # Get stats
-            mock_cursor.fetchone.side_effect = [(1,), (1,)]
-            mock_cursor.fetchall.return_value = [("Progress Note", 1)]
+            mock_cursor.fetchall.return_value = [
+                ("patients", None, 1),
+                ("type", "Progress Note", 1)
+            ]
             stats = client.get_vector_stats()
             assert stats["total_vectors"] == 1
 
@@ -387,7 +766,9 @@ class TestIRISVectorDBClientIntegration:
         client = IRISVectorDBClient()
         client.connect()
 
-        # Mock execute to fail on second insert
+        # Bulk insert fails, so the batch is retried row by row;
+        # the per-row retry fails on the second insert
+        mock_cursor.executemany.side_effect = Exception("Duplicate key")
         mock_cursor.execute.side_effect = [
             None,  # First insert succeeds
             Exception("Duplicate key"),  # Second insert fails
@@ -410,6 +791,9 @@ class TestIRISVectorDBClientIntegration:
 
         assert success_count == 2
         assert failed_count == 1
+        mock_cursor.executemany.assert_called_once()
+        mock_conn.rollback.assert_called_once()
+        assert mock_cursor.execute.call_count == 3
 
 
 # Run tests
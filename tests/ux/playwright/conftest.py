@@ -1,16 +1,39 @@
 import os
 import pytest
 import logging
+import urllib.error
+import urllib.request
+from playwright.sync_api import expect
+from tests.ux.utils.streamlit_helper import wait_for_app_ready
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+VIEWPORT = {"width": 1280, "height": 1024}
+
+# Fast-fail defaults; known-slow waits pass pages.SLOW_TIMEOUT explicitly
+DEFAULT_TIMEOUT = 15_000
+NAVIGATION_TIMEOUT = 30_000
+
+expect.set_options(timeout=DEFAULT_TIMEOUT)
+
 @pytest.fixture(scope="session", autouse=True)
 def validate_environment():
     target_url = os.getenv("TARGET_URL")
     if not target_url:
         pytest.exit("TARGET_URL environment variable is not set. Please set it to the application's URL.")
-    logger.info(f"Targeting application at: {target_url}")
+
+    # Runs once per xdist worker; fail the whole run fast instead of letting
+    # every test time out against an unreachable app
+    try:
+        urllib.request.urlopen(target_url, timeout=10).close()
+    except urllib.error.HTTPError:
+        pass  # The server answered (e.g. 401 behind an auth proxy)
+    except (urllib.error.URLError, OSError) as e:
+        pytest.exit(f"TARGET_URL {target_url} is not reachable: {e}")
+
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    logger.info(f"[{worker}] Targeting application at: {target_url}")
     return target_url
 
 @pytest.fixture(scope="session")
@@ -20,16 +43,65 @@ def target_url():
 def pytest_html_report_title(report):
     report.title = "Medical GraphRAG Assistant UX Verification"
 
-@pytest.fixture(scope="function", autouse=True)
-def handle_login(page, target_url):
-    page.set_viewport_size({"width": 1280, "height": 1024})
-    
+@pytest.fixture(scope="session")
+def handle_login(browser, target_url, tmp_path_factory):
+    """
+    Log in once per session and save the authenticated storage state.
+
+    Every test context is created from this state (see browser_context_args),
+    so the app boot + password round trip is paid once instead of per test.
+    Under pytest-xdist each worker has its own session and its own
+    tmp_path_factory base directory, so workers never share a state file.
+    """
+    state_path = tmp_path_factory.mktemp("auth") / "state.json"
+    context = browser.new_context(viewport=VIEWPORT)
+    page = context.new_page()
+
     test_password = os.getenv("TEST_PASSWORD")
     page.goto(target_url)
-    
+
     if test_password:
         password_input = page.locator('input[type="password"]')
         if password_input.is_visible(timeout=5000):
             password_input.fill(test_password)
             password_input.press("Enter")
-            page.wait_for_load_state("networkidle")
+    wait_for_app_ready(page)
+
+    context.storage_state(path=str(state_path))
+    context.close()
+    return state_path
+
+@pytest.fixture(autouse=True)
+def open_app(page, target_url):
+    """Navigate each test's page to the app exactly once and wait until it is ready."""
+    page.set_default_timeout(DEFAULT_TIMEOUT)
+    page.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
+    page.goto(target_url)
+    wait_for_app_ready(page)
+    return page
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args, handle_login):
+    return {
+        **browser_context_args,
+        "storage_state": str(handle_login),
+        "viewport": VIEWPORT,
+    }
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Refuse to run when the same test module name is collected from two places.
+
+    A stale copy of e.g. test_search.py in another directory would otherwise
+    run every one of its (slow, browser-driven) tests a second time.
+    """
+    seen = {}
+    for item in items:
+        name = getattr(item, "originalname", item.name)
+        key = (item.path.name, name)
+        path = seen.setdefault(key, item.path)
+        if path != item.path:
+            raise pytest.UsageError(
+                f"{name} is collected from both {path} and {item.path}; "
+                "remove the stale copy."
+            )
@@ -0,0 +1,40 @@
+import os
+import re
+from typing import Optional
+from playwright.sync_api import Locator, Page, expect
+from tests.ux.playwright.locators import StreamlitLocators
+
+EXECUTION_DETAILS = re.compile("Execution Details")
+
+# Budget for waits on LLM/tool-calling responses. Everything else uses the
+# 15s default set in conftest.py, so a broken page fails fast.
+SLOW_TIMEOUT = int(os.getenv("PLAYWRIGHT_SLOW_TIMEOUT", "45000"))
+
+def assert_on_app(page: Page, target_url: Optional[str] = None):
+    """
+    Check the test starts on the loaded app (the open_app fixture navigates).
+
+    Cheap replacement for a per-test page.goto(): nothing is reloaded.
+    """
+    target_url = target_url or os.getenv("TARGET_URL")
+    assert page.url.startswith(target_url.rstrip("/")), f"Expected app at {target_url}, page is at {page.url}"
+    expect(page.locator(StreamlitLocators.CHAT_INPUT)).to_be_visible()
+
+def open_execution_details(page: Page, timeout: int = SLOW_TIMEOUT) -> Locator:
+    """
+    Wait for the latest "Execution Details" expander and make sure it is open.
+
+    The expander is only clicked when it is still collapsed, so calling this
+    twice in a test never toggles it shut again.
+    """
+    expander = page.get_by_test_id("stExpander").filter(has_text=EXECUTION_DETAILS).last
+    expect(expander).to_be_visible(timeout=timeout)
+
+    summary = expander.locator("summary").first
+    is_open = (
+        summary.get_attribute("aria-expanded") == "true"
+        or expander.locator("details[open]").count() > 0
+    )
+    if not is_open:
+        summary.click()
+    return expander
@@ -3,10 +3,10 @@ import uuid
 from playwright.sync_api import expect
 from tests.ux.playwright.locators import StreamlitLocators
 from tests.ux.utils.streamlit_helper import wait_for_streamlit
+from tests.ux.playwright.pages import assert_on_app, open_execution_details
 
-def test_memory_lifecycle(page, target_url):
-    page.goto(target_url)
-    wait_for_streamlit(page)
+def test_memory_lifecycle(page):
+    assert_on_app(page)
     
     unique_string = f"TestMemory-{uuid.uuid4()}"
     
@@ -30,9 +30,7 @@ def test_memory_lifecycle(page, target_url):
     
     wait_for_streamlit(page)
     
-    expander = page.locator(StreamlitLocators.EXPANDER).filter(has_text="Execution Details")
-    expect(expander).to_be_visible(timeout=60000)
-    expander.click()
+    expander = open_execution_details(page)
     
     expect(expander).to_contain_text("Recall", ignore_case=True)
     expect(expander).to_contain_text(unique_string)
@@ -2,14 +2,14 @@ import pytest
 from playwright.sync_api import expect
 from tests.ux.playwright.locators import StreamlitLocators
 from tests.ux.utils.streamlit_helper import wait_for_streamlit
+from tests.ux.playwright.pages import SLOW_TIMEOUT, assert_on_app, open_execution_details
 
-def test_allergies_and_images_query(page, target_url):
+def test_allergies_and_images_query(page):
     """
     Test the complex query 'what patients have allergies or medical images'.
     This query triggers multiple tool calls and should succeed without connection errors.
     """
-    page.goto(target_url)
-    wait_for_streamlit(page)
+    assert_on_app(page)
     
     query = "what patients have allergies or medical images"
     chat_input = page.locator(StreamlitLocators.CHAT_INPUT)
@@ -17,13 +17,14 @@ def test_allergies_and_images_query(page, target_url):
     chat_input.press("Enter")
     
     # Wait for assistant message to appear and have some content (Longer timeout for complex query)
+    complex_timeout = 3 * SLOW_TIMEOUT
     assistant_msg = page.locator(StreamlitLocators.ASSISTANT_MESSAGE).last
-    assistant_msg.wait_for(timeout=180000)
-    expect(assistant_msg).not_to_have_text("", timeout=180000)
+    assistant_msg.wait_for(timeout=complex_timeout)
+    expect(assistant_msg).not_to_have_text("", timeout=complex_timeout)
     
     # Wait for Streamlit to finish running (spinning icon to disappear)
     # Increased timeout for complex synthesis
-    wait_for_streamlit(page, timeout=180000)
+    wait_for_streamlit(page, timeout=complex_timeout)
     
     # Verify no connection errors or missing config errors in the response
     # We check the actual visible text in the assistant message
@@ -37,27 +38,7 @@ def test_allergies_and_images_query(page, target_url):
     expect(assistant_msg).not_to_contain_text("patient_ids =", ignore_case=True)
     
     # Open Execution Details
-    expander = page.locator(StreamlitLocators.EXPANDER).filter(has_text="Execution Details")
-    expect(expander).to_be_visible(timeout=60000)
-    
-    # Click the top-level summary to open
-    expander.locator("summary").first.click()
-    
-    # Verify tools were executed successfully (no red X icons)
-    # Streamlit renders ❌ for failed tool executions in our custom UI
-    # We check for the presence of the checkmark ✅ instead
-    expect(expander).to_contain_text("✅", timeout=10000)
-    expect(expander).not_to_contain_text("❌", timeout=10000)
-    
-    # Verify at least one tool was actually called
-    expect(expander).to_contain_text("Tool Execution", ignore_case=True)
-    
-    # Open Execution Details
-    expander = page.locator(StreamlitLocators.EXPANDER).filter(has_text="Execution Details")
-    expect(expander).to_be_visible(timeout=60000)
-    
-    # Click the top-level summary to open
-    expander.locator("summary").first.click()
+    expander = open_execution_details(page)
     
     # Verify tools were executed successfully (no red X icons)
     # Streamlit renders ❌ for failed tool executions in our custom UI
@@ -68,12 +49,11 @@ def test_allergies_and_images_query(page, target_url):
     # Verify at least one tool was actually called
     expect(expander).to_contain_text("Tool Execution", ignore_case=True)
 
-def test_explicit_image_search(page, target_url):
+def test_explicit_image_search(page):
     """
     Force a call to search_medical_images and ensure it succeeds.
     """
-    page.goto(target_url)
-    wait_for_streamlit(page)
+    assert_on_app(page)
     
     query = "Find medical images of pneumonia"
     chat_input = page.locator(StreamlitLocators.CHAT_INPUT)
@@ -81,13 +61,11 @@ def test_explicit_image_search(page, target_url):
     chat_input.press("Enter")
     
     assistant_msg = page.locator(StreamlitLocators.ASSISTANT_MESSAGE).last
-    assistant_msg.wait_for()
-    expect(assistant_msg).not_to_have_text("", timeout=120000)
+    assistant_msg.wait_for(timeout=SLOW_TIMEOUT)
+    expect(assistant_msg).not_to_have_text("", timeout=SLOW_TIMEOUT)
     wait_for_streamlit(page)
     
-    expander = page.locator(StreamlitLocators.EXPANDER).filter(has_text="Execution Details")
-    expect(expander).to_be_visible(timeout=60000)
-    expander.locator("summary").first.click()
+    expander = open_execution_details(page)
     
     # Verify search_medical_images was successful
     expect(expander).to_contain_text("✅ search_medical_images")
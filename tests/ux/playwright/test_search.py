@@ -2,17 +2,16 @@ import pytest
 from playwright.sync_api import expect
 from tests.ux.playwright.locators import StreamlitLocators
 from tests.ux.utils.streamlit_helper import wait_for_streamlit
+from tests.ux.playwright.pages import SLOW_TIMEOUT, assert_on_app, open_execution_details
 
-def test_ui_elements_presence(page, target_url):
-    page.goto(target_url)
-    wait_for_streamlit(page)
+def test_ui_elements_presence(page):
+    assert_on_app(page)
     
     expect(page.locator(StreamlitLocators.SIDEBAR)).to_be_visible()
     expect(page.locator(StreamlitLocators.CHAT_INPUT)).to_be_visible()
 
-def test_fhir_search_decoding(page, target_url):
-    page.goto(target_url)
-    wait_for_streamlit(page)
+def test_fhir_search_decoding(page):
+    assert_on_app(page)
     
     query = "Search FHIR documents for cough"
     chat_input = page.locator(StreamlitLocators.CHAT_INPUT)
@@ -21,17 +20,15 @@ def test_fhir_search_decoding(page, target_url):
     
     # Wait for assistant message to appear and have some content
     assistant_msg = page.locator(StreamlitLocators.ASSISTANT_MESSAGE).last
-    assistant_msg.wait_for()
-    expect(assistant_msg).not_to_have_text("", timeout=120000)
+    assistant_msg.wait_for(timeout=SLOW_TIMEOUT)
+    expect(assistant_msg).not_to_have_text("", timeout=SLOW_TIMEOUT)
     wait_for_streamlit(page)
     
     # STRICT CHECK: Verify no error indicators in the response text
     expect(assistant_msg).not_to_contain_text("error", ignore_case=True)
     
     # Find expander container
-    expander = page.locator(StreamlitLocators.EXPANDER).filter(has_text="Execution Details")
-    expect(expander).to_be_visible(timeout=60000)
-    expander.locator("summary").first.click()
+    expander = open_execution_details(page)
     
     # STRICT CHECK: Verify tool execution was successful
     expect(expander).to_contain_text("✅")
@@ -39,9 +36,8 @@ def test_fhir_search_decoding(page, target_url):
     
     expect(assistant_msg).to_contain_text("cough", ignore_case=True)
 
-def test_kg_search(page, target_url):
-    page.goto(target_url)
-    wait_for_streamlit(page)
+def test_kg_search(page):
+    assert_on_app(page)
     
     query = "Search knowledge graph for fever"
     chat_input = page.locator(StreamlitLocators.CHAT_INPUT)
@@ -49,16 +45,14 @@ def test_kg_search(page, target_url):
     chat_input.press("Enter")
     
     assistant_msg = page.locator(StreamlitLocators.ASSISTANT_MESSAGE).last
-    assistant_msg.wait_for()
-    expect(assistant_msg).not_to_have_text("", timeout=120000)
+    assistant_msg.wait_for(timeout=SLOW_TIMEOUT)
+    expect(assistant_msg).not_to_have_text("", timeout=SLOW_TIMEOUT)
     wait_for_streamlit(page)
     
     # STRICT CHECK: Verify no error indicators
     expect(assistant_msg).not_to_contain_text("error", ignore_case=True)
     
-    expander = page.locator(StreamlitLocators.EXPANDER).filter(has_text="Execution Details")
-    expect(expander).to_be_visible(timeout=60000)
-    expander.locator("summary").first.click()
+    expander = open_execution_details(page)
     
     # STRICT CHECK: Verify success icon
     expect(expander).to_contain_text("✅")
@@ -66,9 +60,8 @@ def test_kg_search(page, target_url):
     
     expect(assistant_msg).to_contain_text("fever", ignore_case=True)
 
-def test_hybrid_search(page, target_url):
-    page.goto(target_url)
-    wait_for_streamlit(page)
+def test_hybrid_search(page):
+    assert_on_app(page)
     
     query = "Hybrid search for chest pain"
     chat_input = page.locator(StreamlitLocators.CHAT_INPUT)
@@ -76,16 +69,14 @@ def test_hybrid_search(page, target_url):
     chat_input.press("Enter")
     
     assistant_msg = page.locator(StreamlitLocators.ASSISTANT_MESSAGE).last
-    assistant_msg.wait_for()
-    expect(assistant_msg).not_to_have_text("", timeout=120000)
+    assistant_msg.wait_for(timeout=SLOW_TIMEOUT)
+    expect(assistant_msg).not_to_have_text("", timeout=SLOW_TIMEOUT)
     wait_for_streamlit(page)
     
     # STRICT CHECK: Verify no error indicators
     expect(assistant_msg).not_to_contain_text("error", ignore_case=True)
     
-    expander = page.locator(StreamlitLocators.EXPANDER).filter(has_text="Execution Details")
-    expect(expander).to_be_visible(timeout=60000)
-    expander.locator("summary").first.click()
+    expander = open_execution_details(page)
     
     # STRICT CHECK: Verify success icon
     expect(expander).to_contain_text("✅")
@@ -93,9 +84,8 @@ def test_hybrid_search(page, target_url):
     
     expect(assistant_msg).to_contain_text("chest pain", ignore_case=True)
 
-def test_image_search(page, target_url):
-    page.goto(target_url)
-    wait_for_streamlit(page)
+def test_image_search(page):
+    assert_on_app(page)
     
     query = "Find medical images of pneumonia"
     chat_input = page.locator(StreamlitLocators.CHAT_INPUT)
@@ -103,16 +93,14 @@ def test_image_search(page, target_url):
     chat_input.press("Enter")
     
     assistant_msg = page.locator(StreamlitLocators.ASSISTANT_MESSAGE).last
-    assistant_msg.wait_for()
-    expect(assistant_msg).not_to_have_text("", timeout=120000)
+    assistant_msg.wait_for(timeout=SLOW_TIMEOUT)
+    expect(assistant_msg).not_to_have_text("", timeout=SLOW_TIMEOUT)
     wait_for_streamlit(page)
     
     # STRICT CHECK: Verify no error indicators
     expect(assistant_msg).not_to_contain_text("error", ignore_case=True)
     
-    expander = page.locator(StreamlitLocators.EXPANDER).filter(has_text="Execution Details")
-    expect(expander).to_be_visible(timeout=60000)
-    expander.locator("summary").first.click()
+    expander = open_execution_details(page)
     
     # STRICT CHECK: Verify success icon
     expect(expander).to_contain_text("✅")
@@ -121,9 +109,8 @@ def test_image_search(page, target_url):
     # Check for image element
     expect(page.locator('img').first).to_be_visible(timeout=30000)
 
-def test_entity_statistics(page, target_url):
-    page.goto(target_url)
-    wait_for_streamlit(page)
+def test_entity_statistics(page):
+    assert_on_app(page)
     
     query = "Show me knowledge graph statistics"
     chat_input = page.locator(StreamlitLocators.CHAT_INPUT)
@@ -131,16 +118,14 @@ def test_entity_statistics(page, target_url):
     chat_input.press("Enter")
     
     assistant_msg = page.locator(StreamlitLocators.ASSISTANT_MESSAGE).last
-    assistant_msg.wait_for()
-    expect(assistant_msg).not_to_have_text("", timeout=120000)
+    assistant_msg.wait_for(timeout=SLOW_TIMEOUT)
+    expect(assistant_msg).not_to_have_text("", timeout=SLOW_TIMEOUT)
     wait_for_streamlit(page)
     
     # STRICT CHECK: Verify no error indicators
     expect(assistant_msg).not_to_contain_text("error", ignore_case=True)
     
-    expander = page.locator(StreamlitLocators.EXPANDER).filter(has_text="Execution Details")
-    expect(expander).to_be_visible(timeout=60000)
-    expander.locator("summary").first.click()
+    expander = open_execution_details(page)
     
     # STRICT CHECK: Verify success icon
     expect(expander).to_contain_text("✅")
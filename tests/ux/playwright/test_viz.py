@@ -2,27 +2,26 @@ import pytest
 from playwright.sync_api import expect
 from tests.ux.playwright.locators import StreamlitLocators
 from tests.ux.utils.streamlit_helper import wait_for_streamlit
+from tests.ux.playwright.pages import SLOW_TIMEOUT, assert_on_app
 
-def test_plotly_rendering(page, target_url):
-    page.goto(target_url)
-    wait_for_streamlit(page)
+def test_plotly_rendering(page):
+    assert_on_app(page)
     
     query = "Plot entity type distribution"
     chat_input = page.locator(StreamlitLocators.CHAT_INPUT)
     chat_input.fill(query)
     chat_input.press("Enter")
     
-    wait_for_streamlit(page, timeout=90000)
+    wait_for_streamlit(page, timeout=SLOW_TIMEOUT)
     
     plotly_chart = page.locator(StreamlitLocators.PLOTLY_CHART)
-    expect(plotly_chart).to_be_visible(timeout=90000)
+    expect(plotly_chart).to_be_visible(timeout=SLOW_TIMEOUT)
     
     plotly_chart.hover()
     expect(plotly_chart.locator('.hoverlayer')).to_be_visible(timeout=5000)
 
-def test_knowledge_graph_rendering(page, target_url):
-    page.goto(target_url)
-    wait_for_streamlit(page)
+def test_knowledge_graph_rendering(page):
+    assert_on_app(page)
     
     query = "Visualize the knowledge graph for diabetes"
     chat_input = page.locator(StreamlitLocators.CHAT_INPUT)
@@ -32,7 +31,7 @@ def test_knowledge_graph_rendering(page, target_url):
     wait_for_streamlit(page)
     
     agraph = page.locator(StreamlitLocators.AGRAPH)
-    expect(agraph).to_be_visible(timeout=60000)
+    expect(agraph).to_be_visible(timeout=SLOW_TIMEOUT)
     
     canvas = agraph.locator('canvas')
     expect(canvas).to_be_visible()
@@ -1,8 +1,17 @@
 from playwright.sync_api import Page
 
 def wait_for_streamlit(page: Page, timeout: int = 30000):
+    # The status widget ("Running...") is only rendered while a script run is
+    # in progress, so waiting for it to go away is a direct "run finished"
+    # signal; networkidle never settles under Streamlit's websocket traffic.
     status_widget = page.locator('[data-testid="stStatusWidget"]')
     status_widget.wait_for(state="hidden", timeout=timeout)
 
+def wait_for_app_ready(page: Page, timeout: int = 30000):
+    # Initial load: the chat input only appears once the first script run has
+    # rendered the page
+    page.locator('[data-testid="stChatInput"]').wait_for(state="visible", timeout=timeout)
+    wait_for_streamlit(page, timeout=timeout)
+
 def get_chat_messages(page: Page):
     return page.locator('[data-testid="stChatMessage"]')